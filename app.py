@@ -1,6 +1,12 @@
+import logging
 from flask import Flask
 from flask_cors import CORS
 from dotenv import load_dotenv
+
+# Show INFO messages from module loggers (e.g. the DynamoDB client) like the prints around them.
+# Set up before the blueprints are imported so nothing logged during import is dropped
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 from mcp.monitor.routes import monitor_bp
 from mcp.infra.routes import infra_bp
 
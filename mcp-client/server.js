@@ -85,9 +85,31 @@ function generateResourceName(resourceType, customerName = '', prefix = '') {
   return finalName;
 }
 
+// Helper to split a Terraform tool result into its log text and outputs.
+// create_* tools return { init, plan?, apply, outputs } (JSON text over MCP), destroy_* return plain text;
+// the logs are joined back into real lines so the patterns below never run over escaped JSON.
+function normalizeTerraformResult(terraformResult) {
+  let result = terraformResult;
+  if (typeof result === 'string') {
+    try {
+      result = JSON.parse(result);
+    } catch {
+      return { log: terraformResult, outputs: '' };
+    }
+  }
+  if (result && typeof result === 'object' && ('apply' in result || 'init' in result)) {
+    const log = ['init', 'plan', 'apply']
+      .map((key) => result[key])
+      .filter((part) => typeof part === 'string')
+      .join('\n');
+    return { log, outputs: result.outputs ? JSON.stringify(result.outputs) : '' };
+  }
+  return { log: typeof result === 'string' ? result : JSON.stringify(result), outputs: '' };
+}
+
 // Helper function to parse Terraform output for success/failure
 function parseTerraformOutput(terraformResult, resourceType, resourceName, isDestroy = false) {
-  const resultStr = typeof terraformResult === 'string' ? terraformResult : JSON.stringify(terraformResult);
+  const { log: resultStr, outputs } = normalizeTerraformResult(terraformResult);
   
   // Check for common success patterns
   const successPatterns = [
@@ -126,7 +148,7 @@ function parseTerraformOutput(terraformResult, resourceType, resourceName, isDes
   
   if (hasSuccess || !hasError) {
     // Extract resource ID or ARN if available
-    const arnMatch = resultStr.match(/arn:aws:[^:]+:[^:]+:[^:]+:([^\s"]+)/);
+    const arnMatch = outputs.match(/arn:aws:[^:]+:[^:]+:[^:]+:([^\s"]+)/) || resultStr.match(/arn:aws:[^:]+:[^:]+:[^:]+:([^\s"]+)/);
     const idMatch = resultStr.match(/id\s*=\s*"?([a-zA-Z0-9-]+)"?/);
     
     let details = '';
@@ -147,8 +169,8 @@ function parseTerraformOutput(terraformResult, resourceType, resourceName, isDes
 
 // Helper to extract identifiers (ID/ARN) from Terraform output
 function extractIdentifiers(terraformResult) {
-  const resultStr = typeof terraformResult === 'string' ? terraformResult : JSON.stringify(terraformResult);
-  const arnMatch = resultStr.match(/arn:aws:[^\s\"]+/);
+  const { log: resultStr, outputs } = normalizeTerraformResult(terraformResult);
+  const arnMatch = outputs.match(/arn:aws:[^\s\"]+/) || resultStr.match(/arn:aws:[^\s\"]+/);
   const idMatch = resultStr.match(/\bid\s*=\s*"?([a-zA-Z0-9-_./:]+)"?/);
   return {
     arn: arnMatch ? arnMatch[0] : null,
@@ -431,8 +453,8 @@ const tools = {
     },
   },
   batchCreate: {
-    description: "Create multiple resources sequentially (stop on first failure). Args: resource_type ['s3'|'ec2'|'lambda'], count [number], customer_name?, aws_region?",
-    run: async ({ resource_type, count, customer_name, aws_region = "us-east-1" }) => {
+    description: "Create multiple resources sequentially (stop on first failure). Args: resource_type ['s3'|'ec2'|'lambda'], count [number], customer_name?, aws_region?, parallelism?",
+    run: async ({ resource_type, count, customer_name, aws_region = "us-east-1", parallelism }) => {
       if (!resource_type || !count) {
         throw new Error("resource_type and count are required");
       }
@@ -444,6 +466,9 @@ const tools = {
       if (!validTypes.includes(resource_type.toLowerCase())) {
         throw new Error(`resource_type must be one of: ${validTypes.join(', ')}`);
       }
+      // Only forward -parallelism when the caller asks for it; otherwise the server's TF_PARALLELISM applies
+      const numParallelism = parseInt(parallelism, 10);
+      const parallelismArg = numParallelism > 0 ? { parallelism: numParallelism } : {};
       console.log(`🔄 Batch creating ${numCount} ${resource_type} resources for ${customer_name || 'default customer'}...`);
       const batchGroupId = Math.floor(100 + Math.random() * 900).toString().padStart(3, '0');
       const results = [];
@@ -459,7 +484,8 @@ const tools = {
               async () => await callTerraformTool("create_ec2_instance", { 
                 instance_count: numCount, 
                 name_prefix: prefixBase, 
-                auto_approve: true 
+                auto_approve: true,
+                ...parallelismArg
               }),
               `Batch create ${numCount} EC2 instances`
             );
@@ -469,7 +495,8 @@ const tools = {
                 bucket_count: numCount,
                 bucket_name_prefix: prefixBase,
                 aws_region,
-                auto_approve: true 
+                auto_approve: true,
+                ...parallelismArg
               }),
               `Batch create ${numCount} S3 buckets`
             );
@@ -479,7 +506,8 @@ const tools = {
                 function_count: numCount,
                 function_name_prefix: prefixBase,
                 aws_region,
-                auto_approve: true 
+                auto_approve: true,
+                ...parallelismArg
               }),
               `Batch create ${numCount} Lambda functions`
             );
@@ -490,7 +518,8 @@ const tools = {
         }
         const resourceTypeDisplay = typeAbbr === 's3' ? 'S3 Buckets' : (typeAbbr === 'lambda' ? 'Lambda Functions' : 'EC2 Instances');
         const parsed = parseTerraformOutput(tfResult, resourceTypeDisplay, prefixBase);
-        const text = typeof tfResult === 'string' ? tfResult : JSON.stringify(tfResult);
+        const { log, outputs } = normalizeTerraformResult(tfResult);
+        const text = `${outputs}\n${log}`;
         console.log(`📝 Registering ${numCount} resources in DynamoDB...`);
         for (let i = 0; i < numCount; i++) {
           const name = `${prefixBase}-${i + 1}`;
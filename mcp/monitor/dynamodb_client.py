@@ -4,11 +4,28 @@ Handles all DynamoDB operations for storing and querying logs and metrics
 Uses boto3 DynamoDB resource API for simplified operations
 """
 import boto3
+import json
+import logging
 import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from itertools import islice
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from pathlib import Path
 
+# Optional: stream large JSON exports during migration instead of loading them whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 project_root = Path(__file__).parent.parent.parent
 env_file = project_root / ".env"
@@ -21,10 +38,51 @@ METRICS_TABLE_NAME = os.getenv("DYNAMODB_TABLE_METRICS", "metrics-table")
 EMPLOYEES_TABLE_NAME = os.getenv("DYNAMODB_TABLE_EMPLOYEES", "employees-table")
 ADMINS_TABLE_NAME = os.getenv("DYNAMODB_TABLE_ADMINS", "admins-table")
 TICKETS_TABLE_NAME = os.getenv("DYNAMODB_TABLE_TICKETS", "tickets-table")
+# JSON export name -> DynamoDB table it is migrated into
+TABLE_NAMES = {
+    "logs": LOGS_TABLE_NAME,
+    "metrics": METRICS_TABLE_NAME,
+    "employees": EMPLOYEES_TABLE_NAME,
+    "admins": ADMINS_TABLE_NAME,
+    "tickets": TICKETS_TABLE_NAME
+}
+
+# BatchWriteItem accepts at most 25 put/delete requests per call
+BATCH_WRITE_SIZE = 25
+# DynamoDB rejects items over 400 KB; 25 such items still fit the 16 MB request limit
+MAX_ITEM_BYTES = 400 * 1024
+# Number of BatchWriteItem calls sent concurrently by batch_insert_logs
+LOG_UPLOAD_WORKERS = int(os.getenv("DYNAMODB_UPLOAD_WORKERS", "16"))
+# Seconds between progress lines during bulk log uploads and deletes
+PROGRESS_INTERVAL = 2
+# Jittered exponential backoff for resending UnprocessedItems (seconds, attempts)
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 5
+RETRY_MAX_ATTEMPTS = 8
+# Primary key fields each JSON export must carry (JSON names, before the log id/time mapping)
+JSON_KEY_FIELDS = {
+    "logs": ("id", "time"),
+    "metrics": ("id",),
+    "employees": ("employee_id",),
+    "admins": ("admin_id",),
+    "tickets": ("ticket_id",)
+}
+# Poll DescribeTable every second (the table_exists default is every 20 s) for up to 2 minutes
+TABLE_WAITER_CONFIG = {"Delay": 1, "MaxAttempts": 120}
 
 # Initialize DynamoDB resource (simpler API than client)
 try:
-    dynamodb_resource = boto3.resource("dynamodb", region_name=DYNAMODB_REGION)
+    # Single session + pooled keep-alive connections, sized for the log upload thread pool
+    boto_session = boto3.session.Session()
+    dynamodb_config = Config(
+        max_pool_connections=max(32, LOG_UPLOAD_WORKERS),
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 10}
+    )
+    dynamodb_resource = boto_session.resource("dynamodb", region_name=DYNAMODB_REGION, config=dynamodb_config)
+    # Plain client (no resource-level type transformation) for the bulk write paths,
+    # which serialize each item once themselves
+    dynamodb_low_level_client = boto_session.client("dynamodb", region_name=DYNAMODB_REGION, config=dynamodb_config)
     # Get table references (will be None if tables don't exist)
     logs_table = dynamodb_resource.Table(LOGS_TABLE_NAME) if LOGS_TABLE_NAME else None
     metrics_table = dynamodb_resource.Table(METRICS_TABLE_NAME) if METRICS_TABLE_NAME else None
@@ -33,6 +91,8 @@ try:
     tickets_table = dynamodb_resource.Table(TICKETS_TABLE_NAME) if TICKETS_TABLE_NAME else None
 except Exception as e:
     # If DynamoDB initialization fails, set tables to None (will fall back to JSON)
+    dynamodb_resource = None
+    dynamodb_low_level_client = None
     logs_table = None
     metrics_table = None
     employees_table = None
@@ -67,15 +127,210 @@ def insert_log(log_data):
         
         return True
     except Exception as e:
-        print(f"Error inserting log: {e}")
+        logger.error(f"Error inserting log: {e}")
         return False
 
 
-def batch_insert_logs(logs_list):
+def _log_item(log_data):
+    """Map a JSON log to the table schema: id -> log_id, time -> timestamp"""
+    item = log_data.copy()
+    
+    # Map "id" to "log_id" for partition key
+    if "id" in item:
+        item["log_id"] = item.pop("id")
+    
+    # Map "time" to "timestamp" for sort key
+    if "time" in item:
+        item["timestamp"] = item.pop("time")
+    
+    # Keep all other fields as-is (customer_name, status, resources_affected, etc.)
+    return item
+
+
+def _key_problem(item, key_fields):
+    """Reason an item can't be written (not an object, missing or non-string key), or None"""
+    if not isinstance(item, dict):
+        return "not a JSON object"
+    for field in key_fields:
+        value = item.get(field)
+        if not isinstance(value, str) or not value:
+            return f"{field} must be a non-empty string"
+    return None
+
+
+def _json_item_problem(table, item):
+    """Schema check for one JSON item of the given table; logs also need an ISO-8601 time"""
+    problem = _key_problem(item, JSON_KEY_FIELDS[table])
+    if problem is None and table == "logs":
+        try:
+            datetime.fromisoformat(item["time"].replace("Z", "+00:00"))
+        except ValueError:
+            problem = f"time {item['time']!r} is not ISO-8601"
+    return problem
+
+
+def validate_json_items(table, items):
+    """
+    Check every item of a JSON export locally, without touching DynamoDB
+    Args: table - Table name key (logs, metrics, employees, admins, tickets), items - Iterable of items
+    Returns: (number of items checked, [(index, item id, problem), ...])
+    """
+    id_field = JSON_KEY_FIELDS[table][0]
+    count = 0
+    invalid = []
+    for index, item in enumerate(items):
+        count += 1
+        problem = _json_item_problem(table, item)
+        if problem:
+            item_id = item.get(id_field, "unknown") if isinstance(item, dict) else "unknown"
+            invalid.append((index, item_id, problem))
+    return count, invalid
+
+
+def _item_size(item):
+    """Estimate an item's stored size in bytes from its compact JSON encoding"""
+    # default=str covers the Decimals that ijson produces
+    return len(json.dumps(item, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _chunks(items, size=BATCH_WRITE_SIZE):
+    """Yield lists of up to size items, consuming the iterable lazily"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+_serializer = TypeSerializer()
+
+
+def _serialize(item):
+    """Convert an item to DynamoDB wire format ({"S": ...}, {"N": ...}, ...)"""
+    return {key: _serializer.serialize(value) for key, value in item.items()}
+
+
+def _batch_write_with_retry(table_name, requests):
+    """
+    Send one BatchWriteItem, resending UnprocessedItems with jittered exponential backoff
+    Args: table_name - Table to write to, requests - List of wire-format write requests (at most 25)
+    Returns: List of write requests still unprocessed after the last attempt
+    """
+    request_items = {table_name: requests}
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        if attempt:
+            # Retrying immediately would just hit the same throttling again
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            time.sleep(delay * random.uniform(0.5, 1.5))
+        response = dynamodb_low_level_client.batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems") or {}
+        if not request_items:
+            return []
+    return request_items.get(table_name, [])
+
+
+def _wire_log_id(item):
+    """log_id of a wire-format item or key, for error messages"""
+    return item.get("log_id", {}).get("S", "unknown")
+
+
+def _insert_log_chunk(chunk):
+    """
+    Write one chunk of logs as a single BatchWriteItem, retrying throttled items
+    Returns: (number inserted, [(log id, error), ...])
+    """
+    items = {}
+    errors = []
+    for log in chunk:
+        try:
+            item = _log_item(log)
+        except Exception as e:
+            errors.append((log.get("id", "unknown"), e))
+            continue
+        # A missing or non-string key would make DynamoDB reject the whole batch
+        problem = _key_problem(item, ("log_id", "timestamp"))
+        if problem:
+            errors.append((item.get("log_id", "unknown"), problem))
+            continue
+        # One oversized item would make DynamoDB reject the whole batch
+        size = _item_size(item)
+        if size > MAX_ITEM_BYTES:
+            errors.append((item.get("log_id", "unknown"), f"item is {size} bytes, over the {MAX_ITEM_BYTES} byte limit"))
+            continue
+        try:
+            wire_item = _serialize(item)
+        except Exception as e:
+            errors.append((item.get("log_id", "unknown"), e))
+            continue
+        # Keep only the last copy of a repeated key within the chunk, which DynamoDB
+        # would otherwise reject as a whole; the dropped copy counts as not inserted
+        key = (item.get("log_id"), item.get("timestamp"))
+        if key in items:
+            errors.append((key[0], f"duplicate key (log_id, timestamp) {key}, replaced by a later copy"))
+        items[key] = wire_item
+    
+    if not items:
+        return 0, errors
+    
+    try:
+        unprocessed = _batch_write_with_retry(
+            LOGS_TABLE_NAME, [{"PutRequest": {"Item": item}} for item in items.values()]
+        )
+    except Exception as e:
+        return 0, errors + [(log_id, e) for log_id, _ in items]
+    for request in unprocessed:
+        errors.append((_wire_log_id(request["PutRequest"]["Item"]), f"still unprocessed after {RETRY_MAX_ATTEMPTS} attempts"))
+    return len(items) - len(unprocessed), errors
+
+
+def _run_bounded(func, chunks, max_workers, collect):
+    """
+    Run func(chunk) for each chunk on a thread pool, consuming chunks lazily
+    At most 2 * max_workers chunks are in flight; collect(result) runs on the calling thread
+    """
+    # Each chunk is one network round trip, so send several at a time; the underlying
+    # low-level client is thread-safe and shares its connection pool between workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        try:
+            for chunk in chunks:
+                # Bound the chunks in flight so a streamed source isn't read far ahead of the requests
+                if len(pending) >= max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+                pending.add(executor.submit(func, chunk))
+        finally:
+            for future in pending:
+                collect(future.result())
+
+
+class _ProgressReporter:
+    """
+    Log a running count at most once every interval seconds
+    Only called from the thread collecting results, so it needs no lock and no timer thread
+    """
+    def __init__(self, verb, interval=PROGRESS_INTERVAL):
+        self.verb = verb
+        self.interval = interval
+        self.started = time.monotonic()
+        self.next_report = self.started + interval
+
+    def update(self, count):
+        now = time.monotonic()
+        if now >= self.next_report:
+            self.next_report = now + self.interval
+            logger.info(f"  ... {count} logs {self.verb} ({count / (now - self.started):.0f}/s)")
+
+
+def batch_insert_logs(logs_list, max_workers=LOG_UPLOAD_WORKERS):
     """
     Batch insert logs into DynamoDB
     Maps JSON fields to table schema: id -> log_id, time -> timestamp
-    Args: logs_list - List of log dictionaries (entire JSON objects)
+    Args:
+        logs_list - Iterable of log dictionaries (entire JSON objects), consumed lazily
+        max_workers - Number of 25-item BatchWriteItem calls in flight at once
     Returns: Number of successfully inserted logs
     Note: Table requires log_id (partition key) and timestamp (sort key)
     """
@@ -84,42 +339,100 @@ def batch_insert_logs(logs_list):
     
     inserted_count = 0
     failed_count = 0
+    progress = _ProgressReporter("inserted")
+    
+    def collect(result):
+        nonlocal inserted_count, failed_count
+        inserted, errors = result
+        inserted_count += inserted
+        progress.update(inserted_count)
+        for log_id, error in errors:
+            failed_count += 1
+            if failed_count <= 5:  # Only log first 5 errors
+                logger.warning(f"  Error inserting log {log_id}: {error}")
     
     try:
-        # Table schema requires: log_id (PK) and timestamp (SK)
-        # JSON has: id and time - need to map them
-        with logs_table.batch_writer() as batch:
-            for log in logs_list:
-                try:
-                    # Map JSON fields to table schema
-                    item = log.copy()
-                    
-                    # Map "id" to "log_id" for partition key
-                    if "id" in item:
-                        item["log_id"] = item.pop("id")
-                    
-                    # Map "time" to "timestamp" for sort key
-                    if "time" in item:
-                        item["timestamp"] = item.pop("time")
-                    
-                    # Keep all other fields as-is (customer_name, status, resources_affected, etc.)
-                    # Store the item with mapped keys
-                    batch.put_item(Item=item)
-                    inserted_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    if failed_count <= 5:  # Only print first 5 errors
-                        print(f"  Error inserting log {log.get('id', 'unknown')}: {e}")
+        _run_bounded(_insert_log_chunk, _chunks(logs_list), max_workers, collect)
         
         if failed_count > 0:
-            print(f"  Warning: {failed_count} logs failed to insert")
+            logger.warning(f"  Warning: {failed_count} logs failed to insert")
         
         return inserted_count
     except Exception as e:
-        print(f"Error in batch insert logs: {e}")
+        logger.error(f"Error in batch insert logs: {e}")
         return inserted_count
 
 
+def _log_keys():
+    """Yield the wire-format primary key of every log, scanning only the key attributes"""
+    scan_kwargs = {
+        "TableName": LOGS_TABLE_NAME,
+        "ProjectionExpression": "log_id, #ts",
+        "ExpressionAttributeNames": {"#ts": "timestamp"}  # timestamp is a reserved word
+    }
+    # Keys stay in wire format, ready to be sent back as DeleteRequests
+    response = dynamodb_low_level_client.scan(**scan_kwargs)
+    yield from response.get("Items", [])
+    
+    # Handle pagination
+    while "LastEvaluatedKey" in response:
+        response = dynamodb_low_level_client.scan(ExclusiveStartKey=response["LastEvaluatedKey"], **scan_kwargs)
+        yield from response.get("Items", [])
+
+
+def _delete_log_chunk(keys):
+    """
+    Delete one chunk of logs by key as a single BatchWriteItem, retrying throttled items
+    Returns: (number deleted, [(log id, error), ...])
+    """
+    try:
+        unprocessed = _batch_write_with_retry(LOGS_TABLE_NAME, [{"DeleteRequest": {"Key": key}} for key in keys])
+    except Exception as e:
+        return 0, [(_wire_log_id(key), e) for key in keys]
+    errors = [
+        (_wire_log_id(request["DeleteRequest"]["Key"]),
+         f"still unprocessed after {RETRY_MAX_ATTEMPTS} attempts")
+        for request in unprocessed
+    ]
+    return len(keys) - len(unprocessed), errors
+
+
+def clear_logs(max_workers=LOG_UPLOAD_WORKERS):
+    """
+    Delete every log from DynamoDB, keeping the table itself
+    Keys are scanned page by page and deleted 25 at a time on a thread pool while the scan continues
+    Args: max_workers - Number of 25-item BatchWriteItem calls in flight at once
+    Returns: Number of deleted logs
+    """
+    if not logs_table:
+        return 0
+    
+    deleted_count = 0
+    failed_count = 0
+    progress = _ProgressReporter("deleted")
+    
+    def collect(result):
+        nonlocal deleted_count, failed_count
+        deleted, errors = result
+        deleted_count += deleted
+        progress.update(deleted_count)
+        for log_id, error in errors:
+            failed_count += 1
+            if failed_count <= 5:  # Only log first 5 errors
+                logger.warning(f"  Error deleting log {log_id}: {error}")
+    
+    try:
+        _run_bounded(_delete_log_chunk, _chunks(_log_keys()), max_workers, collect)
+        
+        if failed_count > 0:
+            logger.warning(f"  Warning: {failed_count} logs failed to delete")
+        
+        return deleted_count
+    except Exception as e:
+        logger.error(f"Error clearing logs: {e}")
+        return deleted_count
+
+
 def insert_resource(resource_data):
     """
     Insert a single resource into DynamoDB (store JSON as-is)
@@ -135,7 +448,7 @@ def insert_resource(resource_data):
         
         return True
     except Exception as e:
-        print(f"Error inserting resource: {e}")
+        logger.error(f"Error inserting resource: {e}")
         return False
 
 
@@ -152,7 +465,7 @@ def batch_insert_resources(resources_list):
     
     try:
         # Store each resource JSON object as-is - no transformation
-        with metrics_table.batch_writer() as batch:
+        with metrics_table.batch_writer(overwrite_by_pkeys=["id"]) as batch:
             for resource in resources_list:
                 # Store the entire resource object as-is
                 batch.put_item(Item=resource)
@@ -160,7 +473,7 @@ def batch_insert_resources(resources_list):
         
         return inserted_count
     except Exception as e:
-        print(f"Error in batch insert resources: {e}")
+        logger.error(f"Error in batch insert resources: {e}")
         return inserted_count
 
 
@@ -194,7 +507,7 @@ def get_log_by_id(log_id):
             return item
         return None
     except Exception as e:
-        print(f"Error getting log by ID: {e}")
+        logger.error(f"Error getting log by ID: {e}")
         return None
 
 
@@ -242,7 +555,7 @@ def get_logs_by_customer(customer_name):
         
         return logs
     except Exception as e:
-        print(f"Error getting logs by customer: {e}")
+        logger.error(f"Error getting logs by customer: {e}")
         return []
 
 
@@ -292,7 +605,7 @@ def get_logs_by_status(status):
         
         return logs
     except Exception as e:
-        print(f"Error getting logs by status: {e}")
+        logger.error(f"Error getting logs by status: {e}")
         return []
 
 
@@ -343,10 +656,10 @@ def get_logs_by_resource(resource_id):
         # If table doesn't exist, return None so fallback can work
         if e.response['Error']['Code'] == 'ResourceNotFoundException':
             return None
-        print(f"Error getting logs by resource: {e}")
+        logger.error(f"Error getting logs by resource: {e}")
         return None
     except Exception as e:
-        print(f"Error getting logs by resource: {e}")
+        logger.error(f"Error getting logs by resource: {e}")
         return None
 
 
@@ -389,13 +702,55 @@ def get_all_logs():
         # If table doesn't exist, return None so fallback can work
         if e.response['Error']['Code'] == 'ResourceNotFoundException':
             return None
-        print(f"Error getting all logs: {e}")
+        logger.error(f"Error getting all logs: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Error getting all logs: {e}")
+        return None
+
+
+def count_logs():
+    """
+    Approximate number of logs in the table, without reading any items
+    Uses DescribeTable's ItemCount, which DynamoDB refreshes about every six hours
+    Returns: Item count or None if the table doesn't exist
+    """
+    try:
+        if not logs_table:
+            return None
+        
+        response = logs_table.meta.client.describe_table(TableName=LOGS_TABLE_NAME)
+        return response["Table"]["ItemCount"]
+    except ClientError as e:
+        # If table doesn't exist, return None so fallback can work
+        if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            return None
+        logger.error(f"Error counting logs: {e}")
         return None
     except Exception as e:
-        print(f"Error getting all logs: {e}")
+        logger.error(f"Error counting logs: {e}")
         return None
 
 
+def table_has_items(table):
+    """
+    Check that the DynamoDB table for a JSON export (e.g. "logs") exists and holds at least one item
+    Reads a single item rather than ItemCount, which can lag by hours
+    Returns: True if it has items, False if it is empty, missing or unreachable
+    """
+    try:
+        response = dynamodb_low_level_client.scan(TableName=TABLE_NAMES[table], Limit=1, Select="COUNT")
+        return response["Count"] > 0
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            return False
+        logger.error(f"Error checking {TABLE_NAMES[table]}: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Error checking {TABLE_NAMES[table]}: {e}")
+        return False
+
+
 def get_resource_by_id(resource_id):
     """
     Get a single resource by its ID (returns JSON as stored)
@@ -418,10 +773,10 @@ def get_resource_by_id(resource_id):
         # If table doesn't exist, raise exception so fallback can work
         if e.response['Error']['Code'] == 'ResourceNotFoundException':
             raise  # Let the caller handle fallback
-        print(f"Error getting resource by ID: {e}")
+        logger.error(f"Error getting resource by ID: {e}")
         return None
     except Exception as e:
-        print(f"Error getting resource by ID: {e}")
+        logger.error(f"Error getting resource by ID: {e}")
         return None
 
 
@@ -453,10 +808,10 @@ def get_all_resources():
         # If table doesn't exist, return None so fallback can work
         if e.response['Error']['Code'] == 'ResourceNotFoundException':
             return None
-        print(f"Error getting all resources: {e}")
+        logger.error(f"Error getting all resources: {e}")
         return None
     except Exception as e:
-        print(f"Error getting all resources: {e}")
+        logger.error(f"Error getting all resources: {e}")
         return None
 
 
@@ -478,7 +833,10 @@ def create_tables():
         "errors": []
     }
     
-    dynamodb_client = boto3.client("dynamodb", region_name=DYNAMODB_REGION)
+    # Reuse the resource's low-level client and its connection pool
+    if dynamodb_resource is None:
+        raise RuntimeError("DynamoDB resource is not initialized")
+    dynamodb_client = dynamodb_resource.meta.client
     
     # Create logs table (uses log_id as partition key to match existing schema)
     try:
@@ -495,14 +853,16 @@ def create_tables():
             "BillingMode": "PAY_PER_REQUEST"
         }
         dynamodb_client.create_table(**logs_table_definition)
-        print(f"Creating logs table: {LOGS_TABLE_NAME}...")
+        logger.info(f"Creating logs table: {LOGS_TABLE_NAME}...")
         waiter = dynamodb_client.get_waiter('table_exists')
-        waiter.wait(TableName=LOGS_TABLE_NAME)
-        print(f"✓ Logs table created successfully")
+        waiter.wait(TableName=LOGS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
+        logger.info(f"✓ Logs table created successfully")
         results["logs_table_created"] = True
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
-            print(f"Logs table {LOGS_TABLE_NAME} already exists")
+            logger.info(f"Logs table {LOGS_TABLE_NAME} already exists")
+            # An existing table may still be CREATING from an earlier run
+            dynamodb_client.get_waiter('table_exists').wait(TableName=LOGS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
             results["logs_table_created"] = True
         else:
             results["errors"].append(f"Error creating logs table: {str(e)}")
@@ -516,14 +876,16 @@ def create_tables():
             "BillingMode": "PAY_PER_REQUEST"
         }
         dynamodb_client.create_table(**metrics_table_definition)
-        print(f"Creating metrics table: {METRICS_TABLE_NAME}...")
+        logger.info(f"Creating metrics table: {METRICS_TABLE_NAME}...")
         waiter = dynamodb_client.get_waiter('table_exists')
-        waiter.wait(TableName=METRICS_TABLE_NAME)
-        print(f"✓ Metrics table created successfully")
+        waiter.wait(TableName=METRICS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
+        logger.info(f"✓ Metrics table created successfully")
         results["metrics_table_created"] = True
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
-            print(f"Metrics table {METRICS_TABLE_NAME} already exists")
+            logger.info(f"Metrics table {METRICS_TABLE_NAME} already exists")
+            # An existing table may still be CREATING from an earlier run
+            dynamodb_client.get_waiter('table_exists').wait(TableName=METRICS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
             results["metrics_table_created"] = True
         else:
             results["errors"].append(f"Error creating metrics table: {str(e)}")
@@ -537,14 +899,16 @@ def create_tables():
             "BillingMode": "PAY_PER_REQUEST"
         }
         dynamodb_client.create_table(**employees_table_definition)
-        print(f"Creating employees table: {EMPLOYEES_TABLE_NAME}...")
+        logger.info(f"Creating employees table: {EMPLOYEES_TABLE_NAME}...")
         waiter = dynamodb_client.get_waiter('table_exists')
-        waiter.wait(TableName=EMPLOYEES_TABLE_NAME)
-        print(f"✓ Employees table created successfully")
+        waiter.wait(TableName=EMPLOYEES_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
+        logger.info(f"✓ Employees table created successfully")
         results["employees_table_created"] = True
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
-            print(f"Employees table {EMPLOYEES_TABLE_NAME} already exists")
+            logger.info(f"Employees table {EMPLOYEES_TABLE_NAME} already exists")
+            # An existing table may still be CREATING from an earlier run
+            dynamodb_client.get_waiter('table_exists').wait(TableName=EMPLOYEES_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
             results["employees_table_created"] = True
         else:
             results["errors"].append(f"Error creating employees table: {str(e)}")
@@ -558,14 +922,16 @@ def create_tables():
             "BillingMode": "PAY_PER_REQUEST"
         }
         dynamodb_client.create_table(**admins_table_definition)
-        print(f"Creating admins table: {ADMINS_TABLE_NAME}...")
+        logger.info(f"Creating admins table: {ADMINS_TABLE_NAME}...")
         waiter = dynamodb_client.get_waiter('table_exists')
-        waiter.wait(TableName=ADMINS_TABLE_NAME)
-        print(f"✓ Admins table created successfully")
+        waiter.wait(TableName=ADMINS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
+        logger.info(f"✓ Admins table created successfully")
         results["admins_table_created"] = True
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
-            print(f"Admins table {ADMINS_TABLE_NAME} already exists")
+            logger.info(f"Admins table {ADMINS_TABLE_NAME} already exists")
+            # An existing table may still be CREATING from an earlier run
+            dynamodb_client.get_waiter('table_exists').wait(TableName=ADMINS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
             results["admins_table_created"] = True
         else:
             results["errors"].append(f"Error creating admins table: {str(e)}")
@@ -579,14 +945,16 @@ def create_tables():
             "BillingMode": "PAY_PER_REQUEST"
         }
         dynamodb_client.create_table(**tickets_table_definition)
-        print(f"Creating tickets table: {TICKETS_TABLE_NAME}...")
+        logger.info(f"Creating tickets table: {TICKETS_TABLE_NAME}...")
         waiter = dynamodb_client.get_waiter('table_exists')
-        waiter.wait(TableName=TICKETS_TABLE_NAME)
-        print(f"✓ Tickets table created successfully")
+        waiter.wait(TableName=TICKETS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
+        logger.info(f"✓ Tickets table created successfully")
         results["tickets_table_created"] = True
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
-            print(f"Tickets table {TICKETS_TABLE_NAME} already exists")
+            logger.info(f"Tickets table {TICKETS_TABLE_NAME} already exists")
+            # An existing table may still be CREATING from an earlier run
+            dynamodb_client.get_waiter('table_exists').wait(TableName=TICKETS_TABLE_NAME, WaiterConfig=TABLE_WAITER_CONFIG)
             results["tickets_table_created"] = True
         else:
             results["errors"].append(f"Error creating tickets table: {str(e)}")
@@ -601,13 +969,13 @@ def batch_insert_employees(employees_list):
     
     inserted_count = 0
     try:
-        with employees_table.batch_writer() as batch:
+        with employees_table.batch_writer(overwrite_by_pkeys=["employee_id"]) as batch:
             for employee in employees_list:
                 batch.put_item(Item=employee)
                 inserted_count += 1
         return inserted_count
     except Exception as e:
-        print(f"Error in batch insert employees: {e}")
+        logger.error(f"Error in batch insert employees: {e}")
         return inserted_count
 
 
@@ -618,13 +986,13 @@ def batch_insert_admins(admins_list):
     
     inserted_count = 0
     try:
-        with admins_table.batch_writer() as batch:
+        with admins_table.batch_writer(overwrite_by_pkeys=["admin_id"]) as batch:
             for admin in admins_list:
                 batch.put_item(Item=admin)
                 inserted_count += 1
         return inserted_count
     except Exception as e:
-        print(f"Error in batch insert admins: {e}")
+        logger.error(f"Error in batch insert admins: {e}")
         return inserted_count
 
 
@@ -635,13 +1003,13 @@ def batch_insert_tickets(tickets_list):
     
     inserted_count = 0
     try:
-        with tickets_table.batch_writer() as batch:
+        with tickets_table.batch_writer(overwrite_by_pkeys=["ticket_id"]) as batch:
             for ticket in tickets_list:
                 batch.put_item(Item=ticket)
                 inserted_count += 1
         return inserted_count
     except Exception as e:
-        print(f"Error in batch insert tickets: {e}")
+        logger.error(f"Error in batch insert tickets: {e}")
         return inserted_count
 
 
@@ -652,19 +1020,49 @@ def batch_insert_metrics_resources(resources_list):
     
     inserted_count = 0
     try:
-        with metrics_table.batch_writer() as batch:
+        with metrics_table.batch_writer(overwrite_by_pkeys=["id"]) as batch:
             for resource in resources_list:
                 batch.put_item(Item=resource)
                 inserted_count += 1
         return inserted_count
     except Exception as e:
-        print(f"Error in batch insert metrics: {e}")
+        logger.error(f"Error in batch insert metrics: {e}")
         return inserted_count
 
 
+class JsonArrayItems:
+    """
+    Iterate over data[key] of a JSON file shaped like {"<key>": [...]}
+    Streams with ijson when stream=True and ijson is installed (numbers come back as Decimal,
+    which is what DynamoDB expects); otherwise loads the file with json.load
+    Counts items as they are consumed so callers can report totals after a single pass;
+    done is set once the whole array has been read
+    """
+    def __init__(self, path, key, stream=True):
+        self.path = path
+        self.key = key
+        self.stream = stream
+        self.count = 0
+        self.done = False
+
+    def _items(self):
+        if self.stream and ijson is not None:
+            with open(self.path, 'rb') as f:
+                yield from ijson.items(f, f"{self.key}.item")
+        else:
+            with open(self.path, 'r') as f:
+                yield from json.load(f).get(self.key, [])
+
+    def __iter__(self):
+        for item in self._items():
+            self.count += 1
+            yield item
+        self.done = True
+
+
 def migrate_json_to_dynamodb(logs_file_path=None, metrics_file_path=None, 
                               employees_file_path=None, admins_file_path=None, 
-                              tickets_file_path=None):
+                              tickets_file_path=None, tables=None, stream=True, clear=False):
     """
     Create DynamoDB tables and migrate all JSON data to DynamoDB
     This function:
@@ -677,10 +1075,11 @@ def migrate_json_to_dynamodb(logs_file_path=None, metrics_file_path=None,
         employees_file_path - Path to employees.json file (optional)
         admins_file_path - Path to admins.json file (optional)
         tickets_file_path - Path to tickets.json file (optional)
-    Returns: Dictionary with migration results
+        tables - Names of the tables to migrate, e.g. {"logs", "tickets"} (optional, default all)
+        stream - Read the JSON files incrementally with ijson when it is installed (default True)
+        clear - Delete every existing log before migrating logs.json (default False)
+    Returns: Dictionary with migration results ("migrated" lists the tables that completed without errors)
     """
-    import json
-    import time
     from pathlib import Path
     
     # Use default paths if not provided
@@ -703,11 +1102,12 @@ def migrate_json_to_dynamodb(logs_file_path=None, metrics_file_path=None,
         "employees_inserted": 0,
         "admins_inserted": 0,
         "tickets_inserted": 0,
+        "migrated": [],
         "errors": []
     }
     
     # Step 1: Create all tables
-    print("=== Step 1: Creating DynamoDB Tables ===")
+    logger.info("=== Step 1: Creating DynamoDB Tables ===")
     try:
         table_results = create_tables()
         results["tables_created"] = {
@@ -721,110 +1121,109 @@ def migrate_json_to_dynamodb(logs_file_path=None, metrics_file_path=None,
     except Exception as e:
         error_msg = f"Error creating tables: {str(e)}"
         results["errors"].append(error_msg)
-        print(error_msg)
+        logger.error(error_msg)
         return results
     
-    # Wait for tables to be ready
-    print("Waiting for tables to be ready...")
-    time.sleep(5)
+    # create_tables() only returns once every table is ACTIVE, so no extra wait is needed
     
     # Step 2: Migrate logs
-    if logs_file_path.exists():
-        print("\n=== Step 2: Migrating Logs ===")
+    if (tables is None or "logs" in tables) and logs_file_path.exists():
+        logger.info("\n=== Step 2: Migrating Logs ===")
         try:
-            with open(logs_file_path, 'r') as f:
-                data = json.load(f)
-                logs = data.get("logs", [])
-                if logs:
-                    print(f"Found {len(logs)} logs to migrate")
-                    print("Inserting logs into DynamoDB (this may take a while)...")
-                    results["logs_inserted"] = batch_insert_logs(logs)
-                    print(f"✓ Migrated {results['logs_inserted']} log items to DynamoDB")
+            logs = JsonArrayItems(logs_file_path, "logs", stream)
+            existing_count = count_logs()
+            if clear:
+                logger.info(f"Clearing existing logs (about {existing_count or 0} items)...")
+                logger.info(f"✓ Deleted {clear_logs()} logs")
+            elif existing_count:
+                logger.info(f"Logs table already holds about {existing_count} items (matching keys are overwritten)")
+            logger.info("Inserting logs into DynamoDB (this may take a while)...")
+            started = time.monotonic()
+            results["logs_inserted"] = batch_insert_logs(logs)
+            elapsed = time.monotonic() - started
+            logger.info(f"✓ Migrated {results['logs_inserted']} of {logs.count} log items to DynamoDB "
+                        f"in {elapsed:.1f}s ({results['logs_inserted'] / max(elapsed, 1e-6):.0f} items/s)")
+            # batch inserts report failures through a short count rather than raising
+            if logs.done and results["logs_inserted"] == logs.count:
+                results["migrated"].append("logs")
         except Exception as e:
             results["errors"].append(f"Error migrating logs: {str(e)}")
     
     # Step 3: Migrate metrics
-    if metrics_file_path.exists():
-        print("\n=== Step 3: Migrating Metrics ===")
+    if (tables is None or "metrics" in tables) and metrics_file_path.exists():
+        logger.info("\n=== Step 3: Migrating Metrics ===")
         try:
-            with open(metrics_file_path, 'r') as f:
-                data = json.load(f)
-                resources = data.get("resources", [])
-                if resources:
-                    print(f"Found {len(resources)} resources to migrate")
-                    results["metrics_inserted"] = batch_insert_metrics_resources(resources)
-                    print(f"✓ Migrated {results['metrics_inserted']} resources to DynamoDB")
+            resources = JsonArrayItems(metrics_file_path, "resources", stream)
+            results["metrics_inserted"] = batch_insert_metrics_resources(resources)
+            logger.info(f"✓ Migrated {results['metrics_inserted']} of {resources.count} resources to DynamoDB")
+            if resources.done and results["metrics_inserted"] == resources.count:
+                results["migrated"].append("metrics")
         except Exception as e:
             results["errors"].append(f"Error migrating metrics: {str(e)}")
     
     # Step 4: Migrate employees
-    if employees_file_path.exists():
-        print("\n=== Step 4: Migrating Employees ===")
+    if (tables is None or "employees" in tables) and employees_file_path.exists():
+        logger.info("\n=== Step 4: Migrating Employees ===")
         try:
-            with open(employees_file_path, 'r') as f:
-                data = json.load(f)
-                employees = data.get("employees", [])
-                if employees:
-                    print(f"Found {len(employees)} employees to migrate")
-                    results["employees_inserted"] = batch_insert_employees(employees)
-                    print(f"✓ Migrated {results['employees_inserted']} employees to DynamoDB")
+            employees = JsonArrayItems(employees_file_path, "employees", stream)
+            results["employees_inserted"] = batch_insert_employees(employees)
+            logger.info(f"✓ Migrated {results['employees_inserted']} of {employees.count} employees to DynamoDB")
+            if employees.done and results["employees_inserted"] == employees.count:
+                results["migrated"].append("employees")
         except Exception as e:
             results["errors"].append(f"Error migrating employees: {str(e)}")
     
     # Step 5: Migrate admins
-    if admins_file_path.exists():
-        print("\n=== Step 5: Migrating Admins ===")
+    if (tables is None or "admins" in tables) and admins_file_path.exists():
+        logger.info("\n=== Step 5: Migrating Admins ===")
         try:
-            with open(admins_file_path, 'r') as f:
-                data = json.load(f)
-                admins = data.get("admins", [])
-                if admins:
-                    print(f"Found {len(admins)} admins to migrate")
-                    results["admins_inserted"] = batch_insert_admins(admins)
-                    print(f"✓ Migrated {results['admins_inserted']} admins to DynamoDB")
+            admins = JsonArrayItems(admins_file_path, "admins", stream)
+            results["admins_inserted"] = batch_insert_admins(admins)
+            logger.info(f"✓ Migrated {results['admins_inserted']} of {admins.count} admins to DynamoDB")
+            if admins.done and results["admins_inserted"] == admins.count:
+                results["migrated"].append("admins")
         except Exception as e:
             results["errors"].append(f"Error migrating admins: {str(e)}")
     
     # Step 6: Migrate tickets
-    if tickets_file_path.exists():
-        print("\n=== Step 6: Migrating Tickets ===")
+    if (tables is None or "tickets" in tables) and tickets_file_path.exists():
+        logger.info("\n=== Step 6: Migrating Tickets ===")
         try:
-            with open(tickets_file_path, 'r') as f:
-                data = json.load(f)
-                tickets = data.get("tickets", [])
-                if tickets:
-                    print(f"Found {len(tickets)} tickets to migrate")
-                    results["tickets_inserted"] = batch_insert_tickets(tickets)
-                    print(f"✓ Migrated {results['tickets_inserted']} tickets to DynamoDB")
-                else:
-                    print("No tickets to migrate (tickets.json is empty)")
+            tickets = JsonArrayItems(tickets_file_path, "tickets", stream)
+            results["tickets_inserted"] = batch_insert_tickets(tickets)
+            if tickets.count:
+                logger.info(f"✓ Migrated {results['tickets_inserted']} of {tickets.count} tickets to DynamoDB")
+            else:
+                logger.info("No tickets to migrate (tickets.json is empty)")
+            if tickets.done and results["tickets_inserted"] == tickets.count:
+                results["migrated"].append("tickets")
         except Exception as e:
             results["errors"].append(f"Error migrating tickets: {str(e)}")
     
     # Summary
-    print("\n" + "=" * 60)
-    print("=== Migration Summary ===")
-    print("=" * 60)
-    print(f"Tables created:")
-    print(f"  - Logs: {results['tables_created'].get('logs', False)}")
-    print(f"  - Metrics: {results['tables_created'].get('metrics', False)}")
-    print(f"  - Employees: {results['tables_created'].get('employees', False)}")
-    print(f"  - Admins: {results['tables_created'].get('admins', False)}")
-    print(f"  - Tickets: {results['tables_created'].get('tickets', False)}")
-    print(f"")
-    print(f"Data migrated:")
-    print(f"  - Logs: {results['logs_inserted']} items")
-    print(f"  - Metrics: {results['metrics_inserted']} items")
-    print(f"  - Employees: {results['employees_inserted']} items")
-    print(f"  - Admins: {results['admins_inserted']} items")
-    print(f"  - Tickets: {results['tickets_inserted']} items")
+    logger.info("\n" + "=" * 60)
+    logger.info("=== Migration Summary ===")
+    logger.info("=" * 60)
+    logger.info(f"Tables created:")
+    logger.info(f"  - Logs: {results['tables_created'].get('logs', False)}")
+    logger.info(f"  - Metrics: {results['tables_created'].get('metrics', False)}")
+    logger.info(f"  - Employees: {results['tables_created'].get('employees', False)}")
+    logger.info(f"  - Admins: {results['tables_created'].get('admins', False)}")
+    logger.info(f"  - Tickets: {results['tables_created'].get('tickets', False)}")
+    logger.info("")
+    logger.info(f"Data migrated:")
+    logger.info(f"  - Logs: {results['logs_inserted']} items")
+    logger.info(f"  - Metrics: {results['metrics_inserted']} items")
+    logger.info(f"  - Employees: {results['employees_inserted']} items")
+    logger.info(f"  - Admins: {results['admins_inserted']} items")
+    logger.info(f"  - Tickets: {results['tickets_inserted']} items")
     
     if results["errors"]:
-        print(f"\nErrors: {len(results['errors'])}")
+        logger.info(f"\nErrors: {len(results['errors'])}")
         for error in results["errors"]:
-            print(f"  - {error}")
+            logger.info(f"  - {error}")
     else:
-        print("\n✓ Migration completed successfully!")
+        logger.info("\n✓ Migration completed successfully!")
     
     return results
 
@@ -9,7 +9,7 @@ from .metrics_updater import update_resource_metrics
 from .ticket_system import (
     create_ticket_from_issue, get_ticket_by_id, load_tickets, approve_critical_ticket,
     reject_critical_ticket, load_employees, load_admins, get_employee_by_id, get_admin_by_id,
-    update_ticket, create_ticket_from_ai_analysis
+    update_ticket, create_tickets_from_ai_analyses, approve_critical_tickets_bulk
 )
 from ..Nvidia_llm.AI_client import analyze_with_nvidia, analyze_metrics_with_nvidia, analyze_logs_with_nvidia, analyze_metrics_for_issues
 
@@ -432,6 +432,36 @@ def approve_ticket(ticket_id):
     return jsonify(result)
 
 
+@monitor_bp.route("/tickets/approve", methods=["POST"])
+def approve_tickets_bulk():
+    """
+    Approve several CRITICAL tickets in one request
+    Body: {
+        "admin_id": "ADMIN001",
+        "tickets": [{"ticket_id": "TCKT_...", "employee_id": "EMP004" (optional)}, ...]
+    }
+    Returns: One result per ticket, in request order
+    """
+    data = request.get_json() or {}
+    admin_id = data.get("admin_id")
+    tickets = data.get("tickets")
+    
+    if not admin_id:
+        return jsonify({"error": "admin_id is required"}), 400
+    if not isinstance(tickets, list) or not all(isinstance(t, dict) and t.get("ticket_id") for t in tickets):
+        return jsonify({"error": "tickets must be a list of objects with a ticket_id"}), 400
+    
+    # Check if admin exists
+    admin = get_admin_by_id(admin_id)
+    if not admin:
+        return jsonify({"error": "Admin not found"}), 404
+    
+    results = approve_critical_tickets_bulk(
+        [(t["ticket_id"], admin_id, t.get("employee_id")) for t in tickets]
+    )
+    return jsonify({"results": results})
+
+
 @monitor_bp.route("/tickets/<ticket_id>/reject", methods=["POST"])
 def reject_ticket(ticket_id):
     """
@@ -490,8 +520,9 @@ def resolve_ticket(ticket_id):
         from .ticket_system import update_employee_workload
         update_employee_workload(ticket.get("assigned_employee_ID"), -1)
     
-    if update_ticket(ticket_id, updates):
-        return jsonify(get_ticket_by_id(ticket_id))
+    updated_ticket = update_ticket(ticket_id, updates)
+    if updated_ticket:
+        return jsonify(updated_ticket)
     return jsonify({"error": "Failed to update ticket"}), 500
 
 
@@ -685,8 +716,9 @@ def analyze_metrics_and_create_tickets():
     if not resources:
         return jsonify({"error": "Resource not found"}), 404
     
-    # Analyze each resource and create tickets
+    # Analyze each resource, then create tickets for all detected issues concurrently
     results = []
+    pending_tickets = []  # (result, ai_analysis, resource)
     
     for resource in resources:
         # Step 1: Analyze metrics with AI
@@ -705,12 +737,7 @@ def analyze_metrics_and_create_tickets():
         has_issue = ai_analysis.get("has_issue", False)
         severity = ai_analysis.get("severity", "OK").upper()
         
-        # Step 3: Create ticket only if issue detected
-        ticket = None
-        if has_issue and severity != "OK":
-            ticket = create_ticket_from_ai_analysis(ai_analysis, resource)
-        
-        # Step 4: Build result
+        # Step 3: Build result (ticket filled in below)
         result = {
             "resource_id": resource.get("id"),
             "resource_name": resource.get("name"),
@@ -721,11 +748,20 @@ def analyze_metrics_and_create_tickets():
                 "description": ai_analysis.get("description"),
                 "recommendations": ai_analysis.get("recommendations")
             },
-            "ticket_created": ticket is not None,
-            "ticket": ticket
+            "ticket_created": False,
+            "ticket": None
         }
         
         results.append(result)
+        
+        # Step 4: Queue ticket creation only if issue detected
+        if has_issue and severity != "OK":
+            pending_tickets.append((result, ai_analysis, resource))
+    
+    tickets = create_tickets_from_ai_analyses((ai_analysis, resource) for _, ai_analysis, resource in pending_tickets)
+    for (result, _, _), ticket in zip(pending_tickets, tickets):
+        result["ticket_created"] = ticket is not None
+        result["ticket"] = ticket
     
     # Summary
     total_resources = len(results)
@@ -5,8 +5,13 @@ Uses DynamoDB with JSON fallback
 """
 import json
 import os
-import uuid
+import secrets
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -19,10 +24,28 @@ TICKETS_FILE = BASE_DIR / "tickets.json"
 EMPLOYEES_FILE = BASE_DIR / "employees.json"
 ADMINS_FILE = BASE_DIR / "admins.json"
 
+# Workload balancing in find_best_employee:
+# score = λ * workload headroom + (1 - λ) * skill/experience score
+WORKLOAD_BALANCE_LAMBDA = 0.7
+# Employees above OVERLOAD_THRESHOLD x mean workload have their score divided by (1 + OVERLOAD_PENALTY)
+OVERLOAD_THRESHOLD = 1.5
+OVERLOAD_PENALTY = 0.5
+
+# Bound once at import; used for ticket timestamps
+_utcnow = datetime.utcnow
+
+# How long (seconds) find_best_employee may reuse the employee list before reloading
+EMPLOYEE_CACHE_TTL = 30
+
+# DynamoDB request limits used by the bulk approval path
+BATCH_GET_MAX_KEYS = 100
+TRANSACT_MAX_ITEMS = 100
+
 # Try to import DynamoDB client
 USE_DYNAMODB = False
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
     
     DYNAMODB_REGION = os.getenv("DYNAMODB_REGION", "us-east-1")
@@ -30,8 +53,14 @@ try:
     EMPLOYEES_TABLE_NAME = os.getenv("DYNAMODB_TABLE_EMPLOYEES", "employees-table")
     ADMINS_TABLE_NAME = os.getenv("DYNAMODB_TABLE_ADMINS", "admins-table")
     
-    # Initialize DynamoDB resource
-    dynamodb = boto3.resource("dynamodb", region_name=DYNAMODB_REGION)
+    # Single session + pooled keep-alive connections shared by all three tables
+    boto_session = boto3.session.Session()
+    dynamodb_config = Config(
+        max_pool_connections=64,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 3}
+    )
+    dynamodb = boto_session.resource("dynamodb", region_name=DYNAMODB_REGION, config=dynamodb_config)
     tickets_table = dynamodb.Table(TICKETS_TABLE_NAME)
     employees_table = dynamodb.Table(EMPLOYEES_TABLE_NAME)
     admins_table = dynamodb.Table(ADMINS_TABLE_NAME)
@@ -73,7 +102,8 @@ def load_employees():
 
 
 def save_employees(data):
-    """Save employees to DynamoDB or JSON fallback"""
+    """Save employees to DynamoDB or JSON fallback (bulk imports - use update_employee_workload for single changes)"""
+    invalidate_employee_cache()
     if USE_DYNAMODB:
         try:
             # Update all employees in DynamoDB
@@ -111,8 +141,52 @@ def get_employee_by_id(employee_id):
     return None
 
 
+# Serializes employee selection + workload updates across threads
+_assignment_lock = threading.Lock()
+
+# Process-level caches used by find_best_employee (see invalidate_employee_cache)
+_employee_cache = {"loaded_at": 0.0, "employees": None}
+_best_employee_cache = {}
+
+
+def invalidate_employee_cache():
+    """Drop cached employees and cached assignment decisions"""
+    _employee_cache["employees"] = None
+    _best_employee_cache.clear()
+
+
+def get_cached_employees():
+    """Return the employee list, reloading it at most every EMPLOYEE_CACHE_TTL seconds"""
+    now = time.monotonic()
+    if _employee_cache["employees"] is None or now - _employee_cache["loaded_at"] > EMPLOYEE_CACHE_TTL:
+        _employee_cache["employees"] = load_employees().get("employees", [])
+        _employee_cache["loaded_at"] = now
+        _best_employee_cache.clear()
+    return _employee_cache["employees"]
+
+
+def _persist_employee(employee):
+    """Write a single employee record to DynamoDB"""
+    employees_table.put_item(Item=employee)
+    return True
+
+
 def update_employee_workload(employee_id, increment=1):
     """Update employee workload (increment or decrement)"""
+    invalidate_employee_cache()
+    if USE_DYNAMODB:
+        try:
+            # Only touch the one employee instead of rewriting the whole table
+            employee = get_employee_by_id(employee_id)
+            if not employee:
+                return False
+            current_workload = employee.get("current_workload", 0)
+            employee["current_workload"] = max(0, current_workload + increment)
+            return _persist_employee(employee)
+        except Exception as e:
+            print(f"Error updating employee workload in DynamoDB, falling back to JSON: {e}")
+
+    # Fallback to JSON
     data = load_employees()
     for employee in data.get("employees", []):
         if employee.get("employee_id") == employee_id:
@@ -276,18 +350,65 @@ def create_ticket(ticket_data):
     return save_tickets(data)
 
 
+def create_tickets_bulk(tickets):
+    """Create several tickets with one DynamoDB batch write or a single JSON rewrite"""
+    if USE_DYNAMODB:
+        try:
+            with tickets_table.batch_writer() as batch:
+                for ticket in tickets:
+                    batch.put_item(Item=ticket)
+            print(f"✅ {len(tickets)} ticket(s) saved to DynamoDB")
+            return True
+        except Exception as e:
+            print(f"Error creating tickets in DynamoDB, falling back to JSON: {e}")
+    
+    # Fallback to JSON
+    data = load_tickets()
+    if "tickets" not in data:
+        data["tickets"] = []
+    
+    data["tickets"].extend(tickets)
+    return save_tickets(data)
+
+
+def _set_expression(updates):
+    """Build a SET UpdateExpression with placeholder names/values for an updates dict"""
+    names = {}
+    values = {}
+    clauses = []
+    for i, (field, value) in enumerate(updates.items()):
+        names[f"#f{i}"] = field
+        values[f":v{i}"] = value
+        clauses.append(f"#f{i} = :v{i}")
+    return "SET " + ", ".join(clauses), names, values
+
+
 def update_ticket(ticket_id, updates):
-    """Update ticket with new data in DynamoDB or JSON"""
+    """
+    Update ticket with new data in DynamoDB or JSON
+    Returns: The updated ticket, or False if it doesn't exist or couldn't be saved
+    """
     if USE_DYNAMODB:
+        if not updates:
+            # An empty SET is invalid; there is nothing to write, so just return the stored ticket
+            return get_ticket_by_id(ticket_id) or False
         try:
-            # Get existing ticket
-            ticket = get_ticket_by_id(ticket_id)
-            if ticket:
-                ticket.update(updates)
-                tickets_table.put_item(Item=ticket)
-                print(f"✅ Ticket {ticket_id} updated in DynamoDB")
-                return True
-            return False
+            # One UpdateItem that returns the new ticket, instead of get + put + get
+            expression, names, values = _set_expression(updates)
+            response = tickets_table.update_item(
+                Key={"ticket_id": ticket_id},
+                UpdateExpression=expression,
+                ConditionExpression="attribute_exists(ticket_id)",
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ReturnValues="ALL_NEW"
+            )
+            print(f"✅ Ticket {ticket_id} updated in DynamoDB")
+            return response["Attributes"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            print(f"Error updating ticket in DynamoDB, falling back to JSON: {e}")
         except Exception as e:
             print(f"Error updating ticket in DynamoDB, falling back to JSON: {e}")
     
@@ -296,7 +417,7 @@ def update_ticket(ticket_id, updates):
     for ticket in data.get("tickets", []):
         if ticket.get("ticket_id") == ticket_id:
             ticket.update(updates)
-            return save_tickets(data)
+            return ticket if save_tickets(data) else False
     return False
 
 
@@ -347,13 +468,31 @@ def score_employee(employee, required_skills, issue_type, specialization_match):
     return round(score, 2)
 
 
+def balanced_score(employee, base_score, mean_workload):
+    """
+    Blend an employee's base score with their workload headroom (both 0-100)
+    Employees loaded above OVERLOAD_THRESHOLD x the mean workload are penalized
+    Returns: Balanced score
+    """
+    current_workload = float(employee.get("current_workload", 0))
+    max_workload = float(employee.get("max_workload", 5))
+    headroom = 1 - (current_workload / max_workload) if max_workload > 0 else 1
+    score = WORKLOAD_BALANCE_LAMBDA * headroom * 100 + (1 - WORKLOAD_BALANCE_LAMBDA) * base_score
+    if mean_workload > 0 and current_workload > OVERLOAD_THRESHOLD * mean_workload:
+        score /= 1 + OVERLOAD_PENALTY
+    return score
+
+
 def find_best_employee(required_skills, issue_type, specialization):
     """
     Find the best employee for a ticket based on scoring
+    Results are cached per (issue_type, specialization, skills) until the employee cache is invalidated
     Returns: Employee dictionary or None
     """
-    data = load_employees()
-    employees = data.get("employees", [])
+    employees = get_cached_employees()
+    cache_key = (issue_type, specialization, tuple(sorted(required_skills)))
+    if cache_key in _best_employee_cache:
+        return _best_employee_cache[cache_key]
     
     # Filter available employees (convert Decimal to float for comparison)
     available_employees = [
@@ -363,39 +502,43 @@ def find_best_employee(required_skills, issue_type, specialization):
     ]
     
     if not available_employees:
+        _best_employee_cache[cache_key] = None
         return None
     
-    # Score all available employees
-    scored_employees = []
-    for employee in available_employees:
-        score = score_employee(employee, required_skills, issue_type, specialization)
-        scored_employees.append((score, employee))
-    
-    # Sort by score (highest first)
-    scored_employees.sort(key=lambda x: x[0], reverse=True)
+    # Balance skills against load so bursts don't pile onto one employee
+    mean_workload = sum(float(emp.get("current_workload", 0)) for emp in available_employees) / len(available_employees)
     
-    # Return best employee
-    if scored_employees:
-        return scored_employees[0][1]
-    return None
+    # Single pass top-1 (first employee wins ties, same as the previous stable sort)
+    best_employee = max(
+        available_employees,
+        key=lambda employee: balanced_score(
+            employee,
+            score_employee(employee, required_skills, issue_type, specialization),
+            mean_workload
+        )
+    )
+    _best_employee_cache[cache_key] = best_employee
+    return best_employee
 
 
+@lru_cache(maxsize=128)
 def determine_required_skills(issue_type, severity):
-    """Determine required skills based on issue type and severity"""
+    """Determine required skills based on issue type and severity (cached - returns a tuple so callers cannot mutate it)"""
     skill_map = {
-        "memory_leak": ["Python", "AWS", "DevOps", "Monitoring"],
-        "cpu_spike": ["AWS", "DevOps", "Performance", "CloudWatch"],
-        "disk_full": ["AWS", "DevOps", "Storage", "EC2"],
-        "network_issue": ["AWS", "Network", "DevOps", "CloudWatch"],
-        "security": ["Security", "AWS", "DevOps", "Compliance"],
-        "error_log": ["Python", "AWS", "DevOps", "Troubleshooting"],
-        "performance": ["Performance", "AWS", "DevOps", "Monitoring"],
-        "infrastructure": ["AWS", "DevOps", "Infrastructure", "CloudWatch"]
+        "memory_leak": ("Python", "AWS", "DevOps", "Monitoring"),
+        "cpu_spike": ("AWS", "DevOps", "Performance", "CloudWatch"),
+        "disk_full": ("AWS", "DevOps", "Storage", "EC2"),
+        "network_issue": ("AWS", "Network", "DevOps", "CloudWatch"),
+        "security": ("Security", "AWS", "DevOps", "Compliance"),
+        "error_log": ("Python", "AWS", "DevOps", "Troubleshooting"),
+        "performance": ("Performance", "AWS", "DevOps", "Monitoring"),
+        "infrastructure": ("AWS", "DevOps", "Infrastructure", "CloudWatch")
     }
     
-    return skill_map.get(issue_type, ["AWS", "DevOps"])
+    return skill_map.get(issue_type, ("AWS", "DevOps"))
 
 
+@lru_cache(maxsize=128)
 def determine_specialization(issue_type):
     """Determine specialization based on issue type"""
     specialization_map = {
@@ -417,22 +560,26 @@ def determine_specialization(issue_type):
 # ============================================================================
 
 def generate_ticket_id():
-    """Generate a unique ticket ID"""
-    return f"TCKT_{str(uuid.uuid4())[:8].upper()}"
+    """Generate a unique ticket ID (8 random hex chars, without building a whole UUID)"""
+    return f"TCKT_{secrets.token_hex(4).upper()}"
 
 
 def create_critical_ticket(issue, resource_id, severity, issue_type, description=None, 
-                          customer_name=None, logs_related=None, metrics_snapshot=None):
+                          customer_name=None, logs_related=None, metrics_snapshot=None,
+                          defer_save=False):
     """
     Create a CRITICAL ticket that requires admin approval
+    defer_save=True returns the ticket without persisting it (caller saves it)
     Returns: Ticket dictionary with PENDING_APPROVAL status
     """
     ticket_id = generate_ticket_id()
+    now = _utcnow().isoformat() + 'Z'
     
     # Determine required skills and suggest employee
     required_skills = determine_required_skills(issue_type, severity)
     specialization = determine_specialization(issue_type)
-    suggested_employee = find_best_employee(required_skills, issue_type, specialization)
+    with _assignment_lock:
+        suggested_employee = find_best_employee(required_skills, issue_type, specialization)
     
     ticket = {
         "ticket_id": ticket_id,
@@ -440,7 +587,7 @@ def create_critical_ticket(issue, resource_id, severity, issue_type, description
         "status": "PENDING_APPROVAL",
         "severity": severity,
         "resource_id": resource_id,
-        "created_at": datetime.utcnow().isoformat() + 'Z',
+        "created_at": now,
         "pending_admin_approval": True,
         "suggested_employee_id": suggested_employee.get("employee_id") if suggested_employee else None,
         "admin_notified": False,
@@ -451,28 +598,35 @@ def create_critical_ticket(issue, resource_id, severity, issue_type, description
         "customer_name": customer_name,
         "logs_related": logs_related or [],
         "metrics_snapshot": metrics_snapshot or {},
-        "required_skills": required_skills,
+        "required_skills": list(required_skills),
         "specialization": specialization
     }
     
-    # Save ticket
-    if create_ticket(ticket):
+    # Save ticket (bulk callers write all their tickets at once instead)
+    if defer_save or create_ticket(ticket):
         return ticket
     return None
 
 
 def create_non_critical_ticket(issue, resource_id, severity, issue_type, description=None,
-                               customer_name=None, logs_related=None, metrics_snapshot=None):
+                               customer_name=None, logs_related=None, metrics_snapshot=None,
+                               defer_save=False):
     """
     Create a NON-CRITICAL ticket and auto-assign to best employee
+    defer_save=True returns the ticket without persisting it (caller saves it)
     Returns: Ticket dictionary with ASSIGNED status
     """
     ticket_id = generate_ticket_id()
+    now = _utcnow().isoformat() + 'Z'
     
     # Determine required skills and find best employee
     required_skills = determine_required_skills(issue_type, severity)
     specialization = determine_specialization(issue_type)
-    assigned_employee = find_best_employee(required_skills, issue_type, specialization)
+    # Pick and claim the employee atomically so concurrent tickets see the new workload
+    with _assignment_lock:
+        assigned_employee = find_best_employee(required_skills, issue_type, specialization)
+        if assigned_employee:
+            update_employee_workload(assigned_employee.get("employee_id"), 1)
     
     if not assigned_employee:
         # If no employee available, create unassigned ticket
@@ -482,7 +636,7 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
             "status": "OPEN",
             "severity": severity,
             "resource_id": resource_id,
-            "created_at": datetime.utcnow().isoformat() + 'Z',
+            "created_at": now,
             "pending_admin_approval": False,
             "assigned_employee_ID": None,
             "assigned_at": None,
@@ -495,7 +649,6 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
     else:
         # Assign to employee
         assigned_employee_id = assigned_employee.get("employee_id")
-        update_employee_workload(assigned_employee_id, 1)
         
         ticket = {
             "ticket_id": ticket_id,
@@ -503,10 +656,10 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
             "status": "ASSIGNED",
             "severity": severity,
             "resource_id": resource_id,
-            "created_at": datetime.utcnow().isoformat() + 'Z',
+            "created_at": now,
             "pending_admin_approval": False,
             "assigned_employee_ID": assigned_employee_id,
-            "assigned_at": datetime.utcnow().isoformat() + 'Z',
+            "assigned_at": now,
             "issue_type": issue_type,
             "description": description or issue,
             "customer_name": customer_name,
@@ -514,97 +667,350 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
             "metrics_snapshot": metrics_snapshot or {}
         }
     
-    # Save ticket
-    if create_ticket(ticket):
+    # Save ticket (bulk callers write all their tickets at once instead)
+    if defer_save or create_ticket(ticket):
         return ticket
     return None
 
 
+# Severity -> creator; anything not listed is auto-assigned as non-critical
+_SEVERITY_DISPATCH = {
+    "CRITICAL": create_critical_ticket
+}
+
+
 def create_ticket_from_issue(issue, resource_id, severity, issue_type, description=None,
-                             customer_name=None, logs_related=None, metrics_snapshot=None):
+                             customer_name=None, logs_related=None, metrics_snapshot=None,
+                             defer_save=False):
     """
     Create a ticket based on severity
     - CRITICAL: Requires admin approval (PENDING_APPROVAL)
     - NON-CRITICAL: Auto-create and assign (ASSIGNED)
     """
     severity_upper = severity.upper() if severity else "MEDIUM"
-    
-    if severity_upper == "CRITICAL":
-        return create_critical_ticket(
-            issue, resource_id, severity_upper, issue_type,
-            description, customer_name, logs_related, metrics_snapshot
-        )
-    else:
-        return create_non_critical_ticket(
-            issue, resource_id, severity_upper, issue_type,
-            description, customer_name, logs_related, metrics_snapshot
-        )
+    create_fn = _SEVERITY_DISPATCH.get(severity_upper, create_non_critical_ticket)
+    return create_fn(
+        issue, resource_id, severity_upper, issue_type,
+        description, customer_name, logs_related, metrics_snapshot, defer_save
+    )
 
 
 # ============================================================================
 # Admin Approval Functions
 # ============================================================================
 
-def approve_critical_ticket(ticket_id, admin_id, employee_id=None):
+def approve_critical_ticket(ticket_id, admin_id, employee_id=None, employees=None):
     """
     Approve a CRITICAL ticket and assign to employee
     If employee_id is None, uses suggested_employee_id
+    employees - Optional employee_id -> employee dict shared across calls, so a batch
+                looks each employee up once
+    With DynamoDB and an explicit employee_id the ticket isn't read before the transaction
+    (its conditions check the ticket); the full ticket is read back once the approval is written
     """
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
-        return {"error": "Ticket not found"}
-    
-    if ticket.get("status") != "PENDING_APPROVAL":
-        return {"error": "Ticket is not pending approval"}
+    ticket = None
+    if not (USE_DYNAMODB and employee_id):
+        # The suggested employee (or the JSON fallback) needs the stored ticket
+        ticket = get_ticket_by_id(ticket_id)
+        error = _pending_approval_error(ticket)
+        if error:
+            return error
     
     # Use provided employee_id or suggested_employee_id
     assigned_employee_id = employee_id or ticket.get("suggested_employee_id")
     if not assigned_employee_id:
         return {"error": "No employee specified for assignment"}
     
-    # Check if employee exists
-    employee = get_employee_by_id(assigned_employee_id)
-    if not employee:
-        return {"error": "Employee not found"}
+    updates = _approval_updates(assigned_employee_id, admin_id, _utcnow().isoformat() + 'Z')
     
-    # Update employee workload
-    update_employee_workload(assigned_employee_id, 1)
+    if USE_DYNAMODB:
+        try:
+            # Workload increment and ticket update in one transaction: both apply or neither does.
+            # Its conditions also check the status and that the employee exists, so no extra reads
+            dynamodb.meta.client.transact_write_items(
+                TransactItems=_approval_transaction([(0, ticket or {"ticket_id": ticket_id}, assigned_employee_id, updates)])
+            )
+            invalidate_employee_cache()
+            if ticket is None:
+                return {"success": True, "ticket": _read_approved_ticket(ticket_id, updates)}
+            ticket.update(updates)
+            return {"success": True, "ticket": ticket}
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "TransactionCanceledException":
+                return _approval_cancellation_error(e)
+            print(f"Error approving ticket in DynamoDB, falling back to JSON: {e}")
+        except Exception as e:
+            print(f"Error approving ticket in DynamoDB, falling back to JSON: {e}")
     
-    # Update ticket
-    updates = {
+    # Fallback to JSON
+    if ticket is None:
+        error = _pending_approval_error(get_ticket_by_id(ticket_id))
+        if error:
+            return error
+    if employees is None:
+        employees = {}
+    if assigned_employee_id not in employees:
+        employees[assigned_employee_id] = get_employee_by_id(assigned_employee_id)
+    if not employees[assigned_employee_id]:
+        return {"error": "Employee not found"}
+    update_employee_workload(assigned_employee_id, 1)
+    updated_ticket = update_ticket(ticket_id, updates)
+    if updated_ticket:
+        return {"success": True, "ticket": updated_ticket}
+    return {"error": "Failed to update ticket"}
+
+
+def _read_approved_ticket(ticket_id, updates):
+    """
+    Read a ticket back after its approval transaction (transactions return no item)
+    Strongly consistent, so the approval fields are already there
+    """
+    try:
+        response = tickets_table.get_item(Key={"ticket_id": ticket_id}, ConsistentRead=True)
+        if "Item" in response:
+            return response["Item"]
+    except Exception as e:
+        # The approval is already written, so this must not fall back to JSON
+        print(f"Error reading approved ticket {ticket_id} from DynamoDB: {e}")
+    return {"ticket_id": ticket_id, **updates}
+
+
+def _pending_approval_error(ticket):
+    """Error dict if a loaded ticket can't be approved or rejected, else None"""
+    if not ticket:
+        return {"error": "Ticket not found"}
+    if ticket.get("status") != "PENDING_APPROVAL":
+        return {"error": "Ticket is not pending approval"}
+    return None
+
+
+def _batch_get(table_name, key_name, ids):
+    """
+    Fetch items by primary key with BatchGetItem (100 keys per request)
+    Returns: Dictionary of key -> item for the items that exist
+    """
+    found = {}
+    ids = list(dict.fromkeys(ids))
+    for start in range(0, len(ids), BATCH_GET_MAX_KEYS):
+        request_items = {table_name: {"Keys": [{key_name: i} for i in ids[start:start + BATCH_GET_MAX_KEYS]]}}
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(table_name, []):
+                found[item[key_name]] = item
+            request_items = response.get("UnprocessedKeys") or {}
+            if request_items:
+                time.sleep(0.05)  # Throttled; give the table a moment before asking again
+    return found
+
+
+def _pending_ticket_update(updates):
+    """UpdateItem arguments that apply updates only while the ticket is PENDING_APPROVAL"""
+    expression, names, values = _set_expression(updates)
+    names["#current_status"] = "status"
+    values[":pending"] = "PENDING_APPROVAL"
+    return {
+        "UpdateExpression": expression,
+        "ConditionExpression": "attribute_exists(ticket_id) AND #current_status = :pending",
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values
+    }
+
+
+def _approval_updates(employee_id, admin_id, now):
+    """Ticket fields set when an admin approves a CRITICAL ticket"""
+    return {
         "status": "ASSIGNED",
         "pending_admin_approval": False,
-        "assigned_employee_ID": assigned_employee_id,
-        "assigned_at": datetime.utcnow().isoformat() + 'Z',
+        "assigned_employee_ID": employee_id,
+        "assigned_at": now,
         "approved_by": admin_id,
-        "approved_at": datetime.utcnow().isoformat() + 'Z'
+        "approved_at": now
     }
-    
-    if update_ticket(ticket_id, updates):
-        return {"success": True, "ticket": get_ticket_by_id(ticket_id)}
-    return {"error": "Failed to update ticket"}
 
 
-def reject_critical_ticket(ticket_id, admin_id, reason=None):
-    """Reject a CRITICAL ticket"""
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
+def _plan_approvals(items, tickets, employees):
+    """
+    Validate approval requests against already-loaded tickets and employees
+    Returns: (results, approvals) - results holds an error dict for each rejected request
+             and None elsewhere; approvals lists (index, ticket, employee_id, updates)
+    """
+    now = _utcnow().isoformat() + 'Z'
+    results = [None] * len(items)
+    approvals = []
+    claimed = set()
+    for i, (ticket_id, admin_id, employee_id) in enumerate(items):
+        ticket = tickets.get(ticket_id)
+        if not ticket:
+            results[i] = {"error": "Ticket not found"}
+            continue
+        # A ticket listed twice is only approved the first time
+        if ticket.get("status") != "PENDING_APPROVAL" or ticket_id in claimed:
+            results[i] = {"error": "Ticket is not pending approval"}
+            continue
+        assigned_employee_id = employee_id or ticket.get("suggested_employee_id")
+        if not assigned_employee_id:
+            results[i] = {"error": "No employee specified for assignment"}
+            continue
+        if assigned_employee_id not in employees:
+            results[i] = {"error": "Employee not found"}
+            continue
+        claimed.add(ticket_id)
+        approvals.append((i, ticket, assigned_employee_id, _approval_updates(assigned_employee_id, admin_id, now)))
+    return results, approvals
+
+
+def _transaction_chunks(approvals):
+    """Split approvals so each chunk's tickets + distinct employees fit in one transaction"""
+    chunk = []
+    employee_ids = set()
+    for approval in approvals:
+        new_employees = employee_ids | {approval[2]}
+        if chunk and len(chunk) + 1 + len(new_employees) > TRANSACT_MAX_ITEMS:
+            yield chunk
+            chunk = []
+            new_employees = {approval[2]}
+        chunk.append(approval)
+        employee_ids = new_employees
+    if chunk:
+        yield chunk
+
+
+def _approval_transaction(chunk):
+    """TransactWriteItems operations for a chunk of approvals (one per ticket and per employee)"""
+    operations = []
+    for _, ticket, _, updates in chunk:
+        # Fails the transaction if another admin got to the ticket first
+        operations.append({"Update": {
+            "TableName": TICKETS_TABLE_NAME,
+            "Key": {"ticket_id": ticket["ticket_id"]},
+            # Tells a missing ticket apart from one that is no longer pending
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+            **_pending_ticket_update(updates)
+        }})
+    # An item may appear only once per transaction, so each employee's tickets are added up
+    for employee_id, count in Counter(approval[2] for approval in chunk).items():
+        operations.append({"Update": {
+            "TableName": EMPLOYEES_TABLE_NAME,
+            "Key": {"employee_id": employee_id},
+            "UpdateExpression": "ADD current_workload :count",
+            "ConditionExpression": "attribute_exists(employee_id)",
+            "ExpressionAttributeValues": {":count": count}
+        }})
+    return operations
+
+
+def _approval_cancellation_error(error):
+    """Map a cancelled single-ticket approval transaction to approve_critical_ticket's error dict"""
+    # Reasons are listed in operation order: the ticket update, then the employee update
+    cancellations = error.response.get("CancellationReasons", [])
+    reasons = [reason.get("Code") for reason in cancellations]
+    if reasons[:1] == ["ConditionalCheckFailed"]:
+        # The old item only comes back when the ticket exists
+        if "Item" in cancellations[0]:
+            return {"error": "Ticket is not pending approval"}
         return {"error": "Ticket not found"}
+    if reasons[1:2] == ["ConditionalCheckFailed"]:
+        return {"error": "Employee not found"}
+    return {"error": "Failed to update ticket"}
+
+
+def approve_critical_tickets_bulk(items):
+    """
+    Approve several CRITICAL tickets at once
+    Reads all tickets and employees with BatchGetItem and writes each chunk of approvals
+    (ticket updates + workload increments) in one TransactWriteItems call
+    Args: items - List of (ticket_id, admin_id, employee_id) tuples; employee_id may be None
+    Returns: List of results in the same order, each shaped like approve_critical_ticket's
+    """
+    items = list(items)
+    if not items:
+        return []
     
-    if ticket.get("status") != "PENDING_APPROVAL":
-        return {"error": "Ticket is not pending approval"}
+    if USE_DYNAMODB:
+        try:
+            tickets = _batch_get(TICKETS_TABLE_NAME, "ticket_id", [item[0] for item in items])
+            employee_ids = [
+                employee_id or tickets.get(ticket_id, {}).get("suggested_employee_id")
+                for ticket_id, _, employee_id in items
+            ]
+            employees = _batch_get(EMPLOYEES_TABLE_NAME, "employee_id", [e for e in employee_ids if e])
+        except Exception as e:
+            print(f"Error loading tickets for bulk approval, approving one at a time: {e}")
+            employees = {}
+            return [approve_critical_ticket(*item, employees=employees) for item in items]
+        
+        results, approvals = _plan_approvals(items, tickets, employees)
+        for chunk in _transaction_chunks(approvals):
+            try:
+                dynamodb.meta.client.transact_write_items(TransactItems=_approval_transaction(chunk))
+            except Exception as e:
+                # One ticket changed under us (or the write failed); settle this chunk ticket by ticket
+                print(f"Bulk approval transaction failed, approving one at a time: {e}")
+                for i, _, _, _ in chunk:
+                    results[i] = approve_critical_ticket(*items[i], employees=employees)
+                continue
+            for i, ticket, _, updates in chunk:
+                ticket.update(updates)
+                results[i] = {"success": True, "ticket": ticket}
+        invalidate_employee_cache()
+        return results
     
-    # Update ticket
+    # Fallback to JSON: one load and one save per file for the whole batch
+    tickets_data = load_tickets()
+    employees_data = load_employees()
+    tickets = {ticket.get("ticket_id"): ticket for ticket in tickets_data.get("tickets", [])}
+    employees = {employee.get("employee_id"): employee for employee in employees_data.get("employees", [])}
+    results, approvals = _plan_approvals(items, tickets, employees)
+    if approvals:
+        for _, ticket, employee_id, updates in approvals:
+            employee = employees[employee_id]
+            employee["current_workload"] = employee.get("current_workload", 0) + 1
+            ticket.update(updates)
+        saved = save_employees(employees_data) and save_tickets(tickets_data)
+        for i, ticket, _, _ in approvals:
+            results[i] = {"success": True, "ticket": ticket} if saved else {"error": "Failed to update ticket"}
+    return results
+
+
+def reject_critical_ticket(ticket_id, admin_id, reason=None):
+    """Reject a CRITICAL ticket"""
+    now = _utcnow().isoformat() + 'Z'
     updates = {
         "status": "REJECTED",
         "pending_admin_approval": False,
         "rejected_by": admin_id,
-        "rejected_at": datetime.utcnow().isoformat() + 'Z',
+        "rejected_at": now,
         "rejection_reason": reason or "Admin rejected"
     }
     
-    if update_ticket(ticket_id, updates):
-        return {"success": True, "ticket": get_ticket_by_id(ticket_id)}
+    if USE_DYNAMODB:
+        try:
+            # The status check happens server-side, so this is the only round trip
+            response = tickets_table.update_item(
+                Key={"ticket_id": ticket_id},
+                ReturnValues="ALL_NEW",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+                **_pending_ticket_update(updates)
+            )
+            return {"success": True, "ticket": response["Attributes"]}
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                # The old item only comes back when the ticket exists
+                if "Item" in e.response:
+                    return {"error": "Ticket is not pending approval"}
+                return {"error": "Ticket not found"}
+            print(f"Error rejecting ticket in DynamoDB, falling back to JSON: {e}")
+        except Exception as e:
+            print(f"Error rejecting ticket in DynamoDB, falling back to JSON: {e}")
+    
+    # Fallback to JSON
+    error = _pending_approval_error(get_ticket_by_id(ticket_id))
+    if error:
+        return error
+    
+    updated_ticket = update_ticket(ticket_id, updates)
+    if updated_ticket:
+        return {"success": True, "ticket": updated_ticket}
     return {"error": "Failed to update ticket"}
 
 
@@ -612,25 +1018,26 @@ def reject_critical_ticket(ticket_id, admin_id, reason=None):
 # AI-Driven Ticket Creation Functions
 # ============================================================================
 
-def create_ticket_from_ai_analysis(ai_analysis, resource):
+# Shared read-only default for resources without tags
+_EMPTY = {}
+
+def create_ticket_from_ai_analysis(ai_analysis, resource, defer_save=False):
     """
     Create a ticket based on AI analysis results
     Only creates ticket if AI detected an issue (has_issue = true and severity != OK)
     Args:
         ai_analysis - Dictionary from analyze_metrics_for_issues() with has_issue, severity, etc.
         resource - Resource object with metrics data
+        defer_save - Build the ticket without persisting it (caller saves it)
     Returns: Ticket dictionary if created, None if no issue detected
     """
-    # Check if there's an error in AI analysis
-    if "error" in ai_analysis:
+    # Bail out before any string work on the common no-issue path (or AI error)
+    if "error" in ai_analysis or not ai_analysis.get("has_issue"):
         return None
     
-    # Check if issue was detected
-    has_issue = ai_analysis.get("has_issue", False)
+    # Only create ticket if severity is not OK
     severity = ai_analysis.get("severity", "OK").upper()
-    
-    # Only create ticket if issue detected and severity is not OK
-    if not has_issue or severity == "OK":
+    if severity == "OK":
         return None
     
     # Extract information from AI analysis
@@ -641,7 +1048,8 @@ def create_ticket_from_ai_analysis(ai_analysis, resource):
     # Get resource information
     resource_id = resource.get("id", "unknown")
     resource_name = resource.get("name", "unknown")
-    customer_name = resource.get("tags", {}).get("customer") or resource.get("tags", {}).get("Name") or "Unknown"
+    tags = resource.get("tags") or _EMPTY
+    customer_name = tags.get("customer") or tags.get("Name") or "Unknown"
     metrics_snapshot = resource.get("metrics", {})
     
     # Create issue description
@@ -660,8 +1068,33 @@ def create_ticket_from_ai_analysis(ai_analysis, resource):
         description=full_description,
         customer_name=customer_name,
         logs_related=[],
-        metrics_snapshot=metrics_snapshot
+        metrics_snapshot=metrics_snapshot,
+        defer_save=defer_save
     )
     
     return ticket
 
+
+def create_tickets_from_ai_analyses(analyses, max_workers=16):
+    """
+    Create tickets for many (ai_analysis, resource) pairs concurrently
+    Employee selection is serialized by _assignment_lock; the tickets are then saved
+    together with one create_tickets_bulk() write
+    Args:
+        analyses - Iterable of (ai_analysis, resource) tuples
+        max_workers - Maximum number of worker threads
+    Returns: List of ticket dictionaries (None where no ticket was created), in input order
+    """
+    analyses = list(analyses)
+    if not analyses:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(analyses))) as executor:
+        tickets = list(executor.map(
+            lambda pair: create_ticket_from_ai_analysis(*pair, defer_save=True), analyses
+        ))
+    
+    created = [ticket for ticket in tickets if ticket]
+    if created and not create_tickets_bulk(created):
+        return [None] * len(tickets)
+    return tickets
@@ -1,10 +1,29 @@
+import asyncio
+import codecs
+import collections
+import contextlib
+import fcntl
+import hashlib
 import subprocess
 import json
 import os
 import sys
 import logging
+import tempfile
 from mcp.server.fastmcp import FastMCP
 
+# Prefer orjson for parsing terraform's JSON output when it's installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 # ----------------------------------------------------------------------
 # ✅ Setup logging (only to stderr, so stdout stays clean for MCP)
 # ----------------------------------------------------------------------
@@ -14,7 +33,31 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
-mcp = FastMCP("terraform")
+class TerraformMCP(FastMCP):
+    """FastMCP that defers schema generation for rarely used tools until a client asks for tools"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_tools = []
+
+    def lazy_tool(self, fn):
+        """Like @mcp.tool(), but registered on the first list_tools/call_tool request"""
+        self._pending_tools.append(fn)
+        return fn
+
+    def _register_pending_tools(self):
+        while self._pending_tools:
+            self.tool()(self._pending_tools.pop(0))
+
+    async def list_tools(self):
+        self._register_pending_tools()
+        return await super().list_tools()
+
+    async def call_tool(self, name, arguments):
+        self._register_pending_tools()
+        return await super().call_tool(name, arguments)
+
+mcp = TerraformMCP("terraform")
 
 # ----------------------------------------------------------------------
 # Terraform Directories
@@ -24,22 +67,228 @@ TERRAFORM_EC2_DIR = os.path.join(TERRAFORM_BASE_DIR, "ec2")
 TERRAFORM_S3_DIR = os.path.join(TERRAFORM_BASE_DIR, "s3")
 TERRAFORM_LAMBDA_DIR = os.path.join(TERRAFORM_BASE_DIR, "lambda")
 
+# Default -parallelism for apply/destroy (terraform's own default is 10); lower it if AWS starts throttling
+TF_PARALLELISM = int(os.getenv("TF_PARALLELISM", "30"))
+
+# Providers downloaded once are shared by the EC2/S3/Lambda working directories
+TF_PLUGIN_CACHE_DIR = os.getenv("TF_PLUGIN_CACHE_DIR", "/app/.terraform-plugin-cache")
+
+# Non-interactive terraform: no checkpoint (version check) HTTP call, no prompts, no ANSI colors
+_TF_ENV = {
+    **os.environ,
+    "CHECKPOINT_DISABLE": "1",
+    "TF_IN_AUTOMATION": "1",
+    "TF_INPUT": "0",
+    "TF_CLI_ARGS": "-no-color",
+}
+try:
+    os.makedirs(TF_PLUGIN_CACHE_DIR, exist_ok=True)
+    _TF_ENV["TF_PLUGIN_CACHE_DIR"] = TF_PLUGIN_CACHE_DIR
+except OSError as e:
+    # e.g. /app isn't writable outside the container; terraform rejects a missing cache dir,
+    # so run without the shared cache rather than failing to start
+    logging.warning(f"Terraform plugin cache disabled, can't create {TF_PLUGIN_CACHE_DIR}: {e}")
+    _TF_ENV.pop("TF_PLUGIN_CACHE_DIR", None)
+
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
-def tf(args: list[str], working_dir: str) -> str:
-    """Execute terraform command in the specified directory"""
+# Only the tail of a command's output is kept; the summary and apply outputs come last
+TF_OUTPUT_LIMIT = 1024 * 1024
+
+async def _run(args: list[str], working_dir: str) -> tuple[int, str]:
+    """Run a command without blocking the event loop; returns (returncode, combined stdout/stderr)"""
     logging.info(f"Running Terraform command: {' '.join(args)} in {working_dir}")
-    result = subprocess.run(args, cwd=working_dir, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise Exception(result.stderr)
-    return result.stdout
+    proc = await asyncio.create_subprocess_exec(
+        *args, cwd=working_dir, env=_TF_ENV,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+    )
+    # Stream output to the log as it arrives and keep at most TF_OUTPUT_LIMIT characters of it
+    chunks = collections.deque()
+    size = 0
+    truncated = False
+    pending = ""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = await proc.stdout.read(65536)
+        text = decoder.decode(chunk, final=not chunk)
+        lines = (pending + text).split("\n")
+        pending = lines.pop() if chunk else ""
+        for line in lines:
+            if line:
+                logging.info(f"[{args[0]}] {line}")
+        chunks.append(text)
+        size += len(text)
+        while size > TF_OUTPUT_LIMIT and len(chunks) > 1:
+            size -= len(chunks.popleft())
+            truncated = True
+        if not chunk:
+            break
+    await proc.wait()
+    output = "".join(chunks)
+    if truncated:
+        # Drop the partial first line left over from trimming
+        output = "... (earlier output truncated)\n" + output[output.find("\n") + 1:]
+    return proc.returncode, output
 
-def tf_with_output(args: list[str], working_dir: str) -> str:
-    """Execute terraform command and return both stdout and stderr"""
+async def _run_stdout(args: list[str], working_dir: str) -> str:
+    """Run a command whose stdout is machine-readable; stderr (warnings) is logged, not mixed in"""
     logging.info(f"Running Terraform command: {' '.join(args)} in {working_dir}")
-    result = subprocess.run(args, cwd=working_dir, capture_output=True, text=True)
-    return result.stdout + result.stderr
+    proc = await asyncio.create_subprocess_exec(
+        *args, cwd=working_dir, env=_TF_ENV,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    stderr = stderr.decode("utf-8", errors="replace")
+    for line in stderr.splitlines():
+        if line:
+            logging.info(f"[{args[0]}] {line}")
+    if proc.returncode != 0:
+        raise Exception(stderr or stdout.decode("utf-8", errors="replace"))
+    return stdout.decode("utf-8", errors="replace")
+
+async def tf(args: list[str], working_dir: str) -> str:
+    """Execute terraform command in the specified directory"""
+    returncode, output = await _run(args, working_dir)
+    if returncode != 0:
+        raise Exception(output)
+    return output
+
+async def tf_with_output(args: list[str], working_dir: str) -> str:
+    """Execute terraform command and return both stdout and stderr"""
+    _, output = await _run(args, working_dir)
+    return output
+
+def split_apply_json(apply_output: str) -> tuple[str, dict]:
+    """Split `terraform apply -json` output into readable log lines and the parsed outputs"""
+    messages = []
+    outputs = {}
+    for line in apply_output.splitlines():
+        try:
+            event = _loads(line)
+        except ValueError:
+            event = None
+        if not isinstance(event, dict):
+            # Plain text (e.g. stderr) passes through unchanged
+            messages.append(line)
+            continue
+        if event.get("type") == "outputs":
+            outputs = event.get("outputs", {})
+        messages.append(event.get("@message", line))
+    return "\n".join(messages), outputs
+
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_file_atomic(path: str, content: str) -> None:
+    """Write a file in one call via temp file + rename so terraform never reads a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        # mkstemp creates 0600 files and os.replace keeps that mode; give the file the
+        # permissions open(path, "w") would (the Lambda archive needs a world-readable handler)
+        os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_file_if_changed(path: str, content: str) -> bool:
+    """Write the file only when its bytes differ, leaving the mtime alone otherwise; returns True if written"""
+    new_hash = hashlib.sha256(content.encode()).hexdigest()
+    try:
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() == new_hash:
+                return False
+    except FileNotFoundError:
+        pass
+    write_file_atomic(path, content)
+    return True
+
+def _lock_mtime(working_dir: str) -> str:
+    try:
+        return repr(os.stat(os.path.join(working_dir, ".terraform.lock.hcl")).st_mtime)
+    except FileNotFoundError:
+        return ""
+
+async def tf_init(working_dir: str) -> str:
+    """Run `terraform init` unless the workdir is initialized and its lock file is unchanged since then"""
+    providers_dir = os.path.join(working_dir, ".terraform", "providers")
+    # Sentinel on disk (not in memory) so a fresh container reusing the workdir also skips init
+    sentinel = os.path.join(working_dir, ".terraform", ".init_done")
+    try:
+        with open(sentinel) as f:
+            recorded = f.read()
+    except FileNotFoundError:
+        recorded = None
+    if recorded == _lock_mtime(working_dir) and os.path.isdir(providers_dir):
+        logging.info(f"Skipping terraform init in {working_dir} (already initialized)")
+        return "Terraform init skipped (already initialized)\n"
+    returncode, output = await _run(["terraform", "init", "-input=false", "-no-color"], working_dir)
+    if returncode == 0:
+        with open(sentinel, "w") as f:
+            f.write(_lock_mtime(working_dir))
+    return output
+
+# `terraform output -json` cached per workdir, valid while terraform.tfstate keeps the same mtime and size
+OUTPUTS_CACHE_FILE = ".outputs.cache.json"
+
+def _state_key(working_dir: str) -> list | None:
+    try:
+        st = os.stat(os.path.join(working_dir, "terraform.tfstate"))
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime, st.st_size]
+
+def cache_outputs(working_dir: str, outputs: dict) -> None:
+    """Remember the outputs for the current state file"""
+    state_key = _state_key(working_dir)
+    if state_key is not None:
+        write_file_atomic(
+            os.path.join(working_dir, OUTPUTS_CACHE_FILE),
+            _dumps({"state": state_key, "outputs": outputs}),
+        )
+
+async def tf_outputs(working_dir: str) -> dict:
+    """Return `terraform output -json`, served from the on-disk cache while the state is unchanged"""
+    try:
+        with open(os.path.join(working_dir, OUTPUTS_CACHE_FILE), "rb") as f:
+            cached = _loads(f.read())
+        if cached.get("state") == _state_key(working_dir):
+            return cached["outputs"]
+    except (FileNotFoundError, ValueError):
+        pass
+    outputs = _loads(await _run_stdout(["terraform", "output", "-json"], working_dir) or "{}")
+    cache_outputs(working_dir, outputs)
+    return outputs
+
+# Per-workdir locks so concurrent tool calls don't run terraform against the same state at once
+_workdir_locks: dict[str, asyncio.Lock] = {}
+
+@contextlib.asynccontextmanager
+async def workdir_lock(working_dir: str, wait: bool = True):
+    """Hold a workdir exclusively: an asyncio.Lock within this server plus flock on .olympus.lock across processes"""
+    lock = _workdir_locks.setdefault(working_dir, asyncio.Lock())
+    if not wait and lock.locked():
+        raise Exception(f"❌ Another Terraform operation is running in {working_dir}, try again later")
+    async with lock:
+        fd = os.open(os.path.join(working_dir, ".olympus.lock"), os.O_CREAT | os.O_RDWR)
+        try:
+            if wait:
+                # flock blocks, so wait for it off the event loop
+                await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+            else:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise Exception(f"❌ Another Terraform operation is running in {working_dir}, try again later")
+            yield
+        finally:
+            # Closing the descriptor releases the flock
+            os.close(fd)
 
 # Health check / Ping tool
 @mcp.tool()
@@ -54,174 +303,203 @@ def ping() -> str:
 # EC2 Tools
 # ----------------------------------------------------------------------
 @mcp.tool()
-def create_ec2_instance(instance_count: int = 1, name_prefix: str = "mcp-demo-instance", auto_approve: bool = True) -> str:
+async def create_ec2_instance(
+    instance_count: int = 1,
+    name_prefix: str = "mcp-demo-instance",
+    auto_approve: bool = True,
+    show_plan: bool = False,
+    parallelism: int = TF_PARALLELISM,
+) -> dict:
     """Create one or more EC2 instances using Terraform with count and name prefix."""
-    # Init terraform
-    init_output = tf_with_output(["terraform", "init", "-input=false"], TERRAFORM_EC2_DIR)
-
-    # Plan with variables (plan is optional informational)
-    plan_cmd = [
-        "terraform", "plan",
-        "-var", f"instance_count={instance_count}",
-        "-var", f"instance_name_prefix={name_prefix}",
-    ]
-    plan_output = tf_with_output(plan_cmd, TERRAFORM_EC2_DIR)
-
-    # Apply with variables
-    apply_cmd = [
-        "terraform", "apply",
-        "-var", f"instance_count={instance_count}",
-        "-var", f"instance_name_prefix={name_prefix}",
-    ]
-    if auto_approve:
-        apply_cmd.append("-auto-approve")
-    apply_output = tf_with_output(apply_cmd, TERRAFORM_EC2_DIR)
-
-    output = tf_with_output(["terraform", "output", "-json"], TERRAFORM_EC2_DIR)
-    return f"INIT:\n{init_output}\nPLAN:\n{plan_output}\nAPPLY:\n{apply_output}\nOUTPUTS:\n{output}"
+    async with workdir_lock(TERRAFORM_EC2_DIR):
+        # Init terraform
+        init_output = await tf_init(TERRAFORM_EC2_DIR)
+
+        tf_vars = [
+            "-var", f"instance_count={instance_count}",
+            "-var", f"instance_name_prefix={name_prefix}",
+        ]
+        result = {"init": init_output}
+
+        # Refresh once: save the plan and apply that file instead of letting apply plan again.
+        # -detailed-exitcode: 0 = no changes, 1 = error, 2 = changes present
+        plan_file = os.path.join(TERRAFORM_EC2_DIR, "tfplan")
+        try:
+            plan_cmd = ["terraform", "plan", "-no-color", "-input=false", "-detailed-exitcode", "-out=tfplan", *tf_vars]
+            if not auto_approve:
+                # A plan that won't be applied is read-only, so don't hold the state lock for it
+                plan_cmd.append("-lock=false")
+            returncode, plan_output = await _run(plan_cmd, TERRAFORM_EC2_DIR)
+            if returncode == 1:
+                raise Exception(plan_output)
+            if show_plan or not auto_approve:
+                result["plan"] = plan_output
+            if not auto_approve:
+                # Nothing is applied without approval; the plan is the result
+                return result
+
+            if returncode == 0:
+                logging.info("No EC2 changes planned, skipping terraform apply")
+                result["apply"] = "No changes. Infrastructure matches the configuration."
+                result["outputs"] = await tf_outputs(TERRAFORM_EC2_DIR)
+                return result
+
+            # A saved plan applies without prompting, so the JSON stream (incl. outputs) is always available
+            apply_cmd = ["terraform", "apply", "-input=false", f"-parallelism={parallelism}", "-json", "tfplan"]
+            result["apply"], result["outputs"] = split_apply_json(await tf_with_output(apply_cmd, TERRAFORM_EC2_DIR))
+            if result["outputs"]:
+                cache_outputs(TERRAFORM_EC2_DIR, result["outputs"])
+            return result
+        finally:
+            if os.path.exists(plan_file):
+                os.remove(plan_file)
 
 @mcp.tool()
-def createEC2(command: str, var_file: str = None, auto_approve: bool = False) -> str:
+async def createEC2(command: str, var_file: str = None, auto_approve: bool = False) -> str:
     """Execute individual Terraform commands for EC2."""
-    cmd = ["terraform", command]
-    if command in ["plan", "apply"] and var_file:
-        cmd.extend(["-var-file", var_file])
-    if command == "apply" and auto_approve:
-        cmd.append("-auto-approve")
-    return tf_with_output(cmd, TERRAFORM_EC2_DIR)
+    async with workdir_lock(TERRAFORM_EC2_DIR):
+        cmd = ["terraform", command]
+        if command in ["plan", "apply"] and var_file:
+            cmd.extend(["-var-file", var_file])
+        if command == "plan":
+            # Standalone plans are only displayed, never applied, so skip the state lock
+            cmd.append("-lock=false")
+        if command == "apply" and auto_approve:
+            cmd.append("-auto-approve")
+        return await tf_with_output(cmd, TERRAFORM_EC2_DIR)
 
-@mcp.tool()
-def destroy_ec2() -> str:
+@mcp.lazy_tool
+async def destroy_ec2() -> str:
     """Destroy EC2 instance"""
-    return tf_with_output(["terraform", "destroy", "-auto-approve"], TERRAFORM_EC2_DIR)
+    async with workdir_lock(TERRAFORM_EC2_DIR, wait=False):
+        return await tf_with_output(["terraform", "destroy", f"-parallelism={TF_PARALLELISM}", "-auto-approve"], TERRAFORM_EC2_DIR)
 
 # ----------------------------------------------------------------------
 # S3 Tools
 # ----------------------------------------------------------------------
 @mcp.tool()
-def create_s3_bucket(
+async def create_s3_bucket(
     bucket_name: str = "",
     bucket_name_prefix: str = "",
     bucket_count: int = 1,
     aws_region: str = "us-east-1",
-    auto_approve: bool = True
-) -> str:
+    auto_approve: bool = True,
+    parallelism: int = TF_PARALLELISM
+) -> dict:
     """Create S3 bucket(s) using Terraform. Use bucket_name for single bucket, or bucket_name_prefix + bucket_count for multiple."""
-    # Support both old (single bucket) and new (batch) interface
-    if bucket_count > 1 and not bucket_name_prefix:
-        raise ValueError("bucket_name_prefix is required when bucket_count > 1")
-    if bucket_count == 1 and not bucket_name and not bucket_name_prefix:
-        raise ValueError("Either bucket_name or bucket_name_prefix is required")
+    async with workdir_lock(TERRAFORM_S3_DIR):
+        # Support both old (single bucket) and new (batch) interface
+        if bucket_count > 1 and not bucket_name_prefix:
+            raise ValueError("bucket_name_prefix is required when bucket_count > 1")
+        if bucket_count == 1 and not bucket_name and not bucket_name_prefix:
+            raise ValueError("Either bucket_name or bucket_name_prefix is required")
     
-    logging.info(f"Creating {bucket_count} S3 bucket(s) in {aws_region}")
-    init_output = tf_with_output(["terraform", "init", "-input=false"], TERRAFORM_S3_DIR)
+        logging.info(f"Creating {bucket_count} S3 bucket(s) in {aws_region}")
+        init_output = await tf_init(TERRAFORM_S3_DIR)
     
-    cmd = ["terraform", "apply"]
-    if bucket_count > 1:
-        cmd.extend(["-var", f"bucket_name_prefix={bucket_name_prefix}"])
-        cmd.extend(["-var", f"bucket_count={bucket_count}"])
-    else:
-        # Single bucket mode (backward compatible)
-        name = bucket_name or bucket_name_prefix
-        cmd.extend(["-var", f"bucket_name={name}"])
-        cmd.extend(["-var", "bucket_count=1"])
+        cmd = ["terraform", "apply", f"-parallelism={parallelism}"]
+        if bucket_count > 1:
+            cmd.extend(["-var", f"bucket_name_prefix={bucket_name_prefix}"])
+            cmd.extend(["-var", f"bucket_count={bucket_count}"])
+        else:
+            # Single bucket mode (backward compatible)
+            name = bucket_name or bucket_name_prefix
+            cmd.extend(["-var", f"bucket_name={name}"])
+            cmd.extend(["-var", "bucket_count=1"])
     
-    cmd.extend(["-var", f"aws_region={aws_region}"])
-    if auto_approve:
-        cmd.append("-auto-approve")
+        cmd.extend(["-var", f"aws_region={aws_region}"])
+        if auto_approve:
+            cmd.extend(["-auto-approve", "-json"])
     
-    apply_output = tf_with_output(cmd, TERRAFORM_S3_DIR)
-    output = tf_with_output(["terraform", "output", "-json"], TERRAFORM_S3_DIR)
-    return f"{init_output}\n{apply_output}\nOutputs:\n{output}"
+        apply_output, outputs = split_apply_json(await tf_with_output(cmd, TERRAFORM_S3_DIR))
+        if outputs:
+            cache_outputs(TERRAFORM_S3_DIR, outputs)
+        return {"init": init_output, "apply": apply_output, "outputs": outputs}
 
-@mcp.tool()
-def destroy_s3_bucket(bucket_name: str, auto_approve: bool = True) -> str:
+@mcp.lazy_tool
+async def destroy_s3_bucket(bucket_name: str, auto_approve: bool = True) -> str:
     """Safely destroy an S3 bucket via Terraform."""
-    logging.info(f"Destroy request received for bucket: {bucket_name}")
+    async with workdir_lock(TERRAFORM_S3_DIR, wait=False):
+        logging.info(f"Destroy request received for bucket: {bucket_name}")
     
-    # Verify credentials
-    if not os.getenv("AWS_ACCESS_KEY_ID"):
-        raise Exception("❌ Missing AWS credentials in environment. Please export them first.")
+        # Verify credentials
+        if not os.getenv("AWS_ACCESS_KEY_ID"):
+            raise Exception("❌ Missing AWS credentials in environment. Please export them first.")
 
-    # Init Terraform
-    logging.info("Initializing Terraform...")
-    init_output = tf_with_output(["terraform", "init", "-input=false"], TERRAFORM_S3_DIR)
+        # Init Terraform
+        logging.info("Initializing Terraform...")
+        init_output = await tf_init(TERRAFORM_S3_DIR)
 
-    # Destroy bucket with variable
-    destroy_cmd = ["terraform", "destroy", "-var", f"bucket_name={bucket_name}", "-var", "aws_region=us-east-1"]
-    if auto_approve:
-        destroy_cmd.append("-auto-approve")
-    logging.info(f"Executing: {' '.join(destroy_cmd)}")
+        # Destroy bucket with variable
+        destroy_cmd = ["terraform", "destroy", f"-parallelism={TF_PARALLELISM}", "-var", f"bucket_name={bucket_name}", "-var", "aws_region=us-east-1"]
+        if auto_approve:
+            destroy_cmd.append("-auto-approve")
+        logging.info(f"Executing: {' '.join(destroy_cmd)}")
 
-    destroy_output = tf_with_output(destroy_cmd, TERRAFORM_S3_DIR)
-    logging.info(f"✅ Destroy command completed for bucket {bucket_name}")
+        destroy_output = await tf_with_output(destroy_cmd, TERRAFORM_S3_DIR)
+        logging.info(f"✅ Destroy command completed for bucket {bucket_name}")
 
-    return f"{init_output}\n{destroy_output}"
+        return f"{init_output}\n{destroy_output}"
 
 # ----------------------------------------------------------------------
 # Lambda Tools
 # ----------------------------------------------------------------------
 @mcp.tool()
-def create_lambda_function(
+async def create_lambda_function(
     function_name: str = "",
     function_name_prefix: str = "",
     function_count: int = 1,
     aws_region: str = "us-east-1",
     source_code: str = None,
-    auto_approve: bool = True
-) -> str:
+    auto_approve: bool = True,
+    parallelism: int = TF_PARALLELISM
+) -> dict:
     """Create Lambda function(s) using Terraform. Use function_name for single function, or function_name_prefix + function_count for multiple."""
-    # Support both old (single function) and new (batch) interface
-    if function_count > 1 and not function_name_prefix:
-        raise ValueError("function_name_prefix is required when function_count > 1")
-    if function_count == 1 and not function_name and not function_name_prefix:
-        raise ValueError("Either function_name or function_name_prefix is required")
+    async with workdir_lock(TERRAFORM_LAMBDA_DIR):
+        # Support both old (single function) and new (batch) interface
+        if function_count > 1 and not function_name_prefix:
+            raise ValueError("function_name_prefix is required when function_count > 1")
+        if function_count == 1 and not function_name and not function_name_prefix:
+            raise ValueError("Either function_name or function_name_prefix is required")
+    
+        if source_code is None:
+            source_code = "def handler(event, context):\n    return {'statusCode': 200, 'body': 'Hello from Lambda!'}"
     
-    if source_code is None:
-        source_code = "def handler(event, context):\n    return {'statusCode': 200, 'body': 'Hello from Lambda!'}"
+        logging.info(f"Creating {function_count} Lambda function(s) in {aws_region}")
+        init_output = await tf_init(TERRAFORM_LAMBDA_DIR)
     
-    logging.info(f"Creating {function_count} Lambda function(s) in {aws_region}")
-    init_output = tf_with_output(["terraform", "init", "-input=false"], TERRAFORM_LAMBDA_DIR)
+        # The source file is kept between calls: identical code leaves it untouched, so the
+        # archive_file zip and the function's code hash don't change and nothing is re-uploaded
+        source_file = os.path.join(TERRAFORM_LAMBDA_DIR, "lambda_function.py")
+        if not write_file_if_changed(source_file, source_code):
+            logging.info("Lambda source unchanged, reusing the existing deployment package")
     
-    tfvars_file = os.path.join(TERRAFORM_LAMBDA_DIR, "terraform.tfvars")
-    with open(tfvars_file, 'w') as f:
+        cmd = ["terraform", "apply", f"-parallelism={parallelism}"]
         if function_count > 1:
-            f.write(f'function_name_prefix = "{function_name_prefix}"\n')
-            f.write(f'function_count = {function_count}\n')
+            cmd.extend(["-var", f"function_name_prefix={function_name_prefix}"])
+            cmd.extend(["-var", f"function_count={function_count}"])
         else:
             # Single function mode (backward compatible)
             name = function_name or function_name_prefix
-            f.write(f'function_name = "{name}"\n')
-            f.write(f'function_count = 1\n')
-        
-        f.write(f'aws_region = "{aws_region}"\n')
-        f.write('source_code_file = "/app/terraform/lambda/lambda_function.py"\n')
-    
-    # Also write the source code file
-    source_file = os.path.join(TERRAFORM_LAMBDA_DIR, "lambda_function.py")
-    with open(source_file, 'w') as f:
-        f.write(source_code)
-    
-    try:
-        cmd = ["terraform", "apply", "-var-file", "terraform.tfvars"]
+            cmd.extend(["-var", f"function_name={name}"])
+            cmd.extend(["-var", "function_count=1"])
+        cmd.extend(["-var", f"aws_region={aws_region}"])
+        cmd.extend(["-var", f"source_code_file={source_file}"])
         if auto_approve:
-            cmd.append("-auto-approve")
-        apply_output = tf_with_output(cmd, TERRAFORM_LAMBDA_DIR)
-        output = tf_with_output(["terraform", "output", "-json"], TERRAFORM_LAMBDA_DIR)
-        return f"{init_output}\n{apply_output}\nOutputs:\n{output}"
-    finally:
-        if os.path.exists(tfvars_file):
-            os.remove(tfvars_file)
-        if os.path.exists(source_file):
-            os.remove(source_file)
+            cmd.extend(["-auto-approve", "-json"])
+        apply_output, outputs = split_apply_json(await tf_with_output(cmd, TERRAFORM_LAMBDA_DIR))
+        if outputs:
+            cache_outputs(TERRAFORM_LAMBDA_DIR, outputs)
+        return {"init": init_output, "apply": apply_output, "outputs": outputs}
 
-@mcp.tool()
-def destroy_lambda_function(auto_approve: bool = True) -> str:
+@mcp.lazy_tool
+async def destroy_lambda_function(auto_approve: bool = True) -> str:
     """Destroy Lambda function."""
-    cmd = ["terraform", "destroy"]
-    if auto_approve:
-        cmd.append("-auto-approve")
-    return tf_with_output(cmd, TERRAFORM_LAMBDA_DIR)
+    async with workdir_lock(TERRAFORM_LAMBDA_DIR, wait=False):
+        cmd = ["terraform", "destroy", f"-parallelism={TF_PARALLELISM}"]
+        if auto_approve:
+            cmd.append("-auto-approve")
+        return await tf_with_output(cmd, TERRAFORM_LAMBDA_DIR)
 
 # ----------------------------------------------------------------------
 # MCP Entry Point
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import json
 import sys
 import os
@@ -15,93 +16,77 @@ from mcp_server import (
     destroy_lambda_function,
 )
 
+# Prefer orjson for serializing tool output when it's installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
 
 def _print(obj):
     if isinstance(obj, (dict, list)):
-        print(json.dumps(obj))
+        print(_dumps(obj))
     else:
         # Many tool functions return plain text; keep as-is
         print(obj)
 
 
-def main():
+def build_parser():
+    """Subcommands carry their tool function; options become its keyword arguments"""
     parser = argparse.ArgumentParser(description="Run Terraform MCP tools via CLI wrapper")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Ping
-    subparsers.add_parser("ping")
+    subparsers.add_parser("ping").set_defaults(func=mcp_ping)
 
     # S3
     s3_create = subparsers.add_parser("s3.create")
     s3_create.add_argument("--bucket_name", required=True)
     s3_create.add_argument("--aws_region", default="us-east-1")
+    s3_create.set_defaults(func=create_s3_bucket)
     s3_destroy = subparsers.add_parser("s3.destroy")
     s3_destroy.add_argument("--bucket_name", required=True)
     s3_destroy.add_argument("--auto_approve", default="true")
+    s3_destroy.set_defaults(func=destroy_s3_bucket)
 
     # EC2
     ec2_create = subparsers.add_parser("ec2.create")
     ec2_create.add_argument("--auto_approve", default="true")
-    subparsers.add_parser("ec2.destroy")
+    ec2_create.set_defaults(func=create_ec2_instance)
+    subparsers.add_parser("ec2.destroy").set_defaults(func=destroy_ec2)
 
     # Lambda
     lam_create = subparsers.add_parser("lambda.create")
     lam_create.add_argument("--function_name", required=True)
     lam_create.add_argument("--aws_region", default="us-east-1")
     lam_create.add_argument("--source_code", default=None)
+    lam_create.set_defaults(func=create_lambda_function)
     lam_destroy = subparsers.add_parser("lambda.destroy")
     lam_destroy.add_argument("--auto_approve", default="true")
+    lam_destroy.set_defaults(func=destroy_lambda_function)
+
+    return parser
+
 
-    args = parser.parse_args()
+def main(argv=None):
+    kwargs = vars(build_parser().parse_args(argv))
+    del kwargs["command"]
+    fn = kwargs.pop("func")
+    if "auto_approve" in kwargs:
+        kwargs["auto_approve"] = str(kwargs["auto_approve"]).lower() == "true"
 
     try:
-        if args.command == "ping":
-            _print(mcp_ping())
-            return 0
-
-        if args.command == "s3.create":
-            out = create_s3_bucket(bucket_name=args.bucket_name, aws_region=args.aws_region, auto_approve=True)
-            _print(out)
-            return 0
-
-        if args.command == "s3.destroy":
-            auto = str(args.auto_approve).lower() == "true"
-            out = destroy_s3_bucket(bucket_name=args.bucket_name, auto_approve=auto)
-            _print(out)
-            return 0
-
-        if args.command == "ec2.create":
-            auto = str(args.auto_approve).lower() == "true"
-            out = create_ec2_instance(auto_approve=auto)
-            _print(out)
-            return 0
-
-        if args.command == "ec2.destroy":
-            out = destroy_ec2()
-            _print(out)
-            return 0
-
-        if args.command == "lambda.create":
-            out = create_lambda_function(
-                function_name=args.function_name,
-                aws_region=args.aws_region,
-                source_code=args.source_code,
-                auto_approve=True,
-            )
-            _print(out)
-            return 0
-
-        if args.command == "lambda.destroy":
-            auto = str(args.auto_approve).lower() == "true"
-            out = destroy_lambda_function(auto_approve=auto)
-            _print(out)
-            return 0
-
-        print(json.dumps({"error": f"Unknown command {args.command}"}))
-        return 2
+        out = fn(**kwargs)
+        if asyncio.iscoroutine(out):
+            out = asyncio.run(out)
+        _print(out)
+        return 0
     except Exception as e:
         # Print as JSON error to make it easy for callers to parse
-        print(json.dumps({"error": str(e)}))
+        print(_dumps({"error": str(e)}))
         return 1
 
 
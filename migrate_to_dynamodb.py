@@ -6,41 +6,196 @@ This script creates DynamoDB tables and migrates all JSON files:
 - employees.json -> employees-table
 - admins.json -> admins-table
 - tickets.json -> tickets-table
+
+Tables whose JSON file is unchanged since the last successful migration are skipped
+(SHA-256 of each file is kept in .migration_state.json, per region, endpoint and table name),
+unless the target table has since been deleted or emptied.
+
+Every changed file is validated locally (keys present, log times in ISO-8601) before anything
+is written; the migration stops if any item is invalid.
+
+Usage: python migrate_to_dynamodb.py [--clear] [--dry-run] [--force]
+  --clear    Delete every existing log first, then migrate logs.json even if it is unchanged
+  --dry-run  Only validate the files that would be migrated, without contacting DynamoDB
+  --force    Migrate every JSON file, ignoring the saved state
 """
+import argparse
+import atexit
+import hashlib
+import json
+import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from mcp.monitor.dynamodb_client import migrate_json_to_dynamodb
+from mcp.monitor.dynamodb_client import (
+    DYNAMODB_REGION, TABLE_NAMES, JsonArrayItems, dynamodb_low_level_client,
+    migrate_json_to_dynamodb, table_has_items, validate_json_items
+)
+
+BANNER = """\
+============================================================
+DynamoDB Migration Script - All JSON Data
+============================================================
+
+This script will:
+1. Create DynamoDB tables (logs, metrics, employees, admins, tickets)
+2. Load data from JSON files
+3. Insert all data into DynamoDB
+
+Files to migrate:
+  - logs.json -> logs-table
+  - metrics.json -> metrics-table
+  - employees.json -> employees-table
+  - admins.json -> admins-table
+  - tickets.json -> tickets-table
+"""
+
+STATE_FILE = project_root / ".migration_state.json"
+SOURCE_FILES = {
+    "logs": project_root / "logs.json",
+    "metrics": project_root / "metrics.json",
+    "employees": project_root / "employees.json",
+    "admins": project_root / "admins.json",
+    "tickets": project_root / "tickets.json",
+}
+
+
+def file_sha256(path):
+    """SHA-256 of a file, read in chunks so large exports aren't loaded at once"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def state_key(table):
+    """
+    Key a table's saved hash by where it was migrated to, so switching region,
+    endpoint (e.g. DynamoDB Local) or table name migrates it again
+    """
+    endpoint = dynamodb_low_level_client.meta.endpoint_url if dynamodb_low_level_client else None
+    return f"{DYNAMODB_REGION}|{endpoint}|{TABLE_NAMES[table]}"
+
+
+def load_state():
+    """Load state key -> file hash from the last successful migration"""
+    try:
+        with open(STATE_FILE, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state):
+    with open(STATE_FILE, "w") as f:
+        json.dump(state, f, indent=2)
+
+
+def validate_files(tables, logger):
+    """Validate the JSON files of the given tables; Returns True if every item is valid"""
+    valid = True
+    for table in sorted(tables):
+        count, invalid = validate_json_items(table, JsonArrayItems(SOURCE_FILES[table], table))
+        if not invalid:
+            logger.info(f"✓ {SOURCE_FILES[table].name}: {count} items valid")
+            continue
+        valid = False
+        logger.error(f"✗ {SOURCE_FILES[table].name}: {len(invalid)} of {count} items invalid")
+        for index, item_id, problem in invalid[:10]:  # Only show first 10
+            logger.error(f"  - item {index} ({item_id}): {problem}")
+    return valid
+
+
+def parse_args():
+    """Parse the command-line options; unknown options are an error"""
+    parser = argparse.ArgumentParser(description="Migrate the JSON data files into DynamoDB")
+    parser.add_argument("--clear", action="store_true",
+                        help="delete every existing log first, then migrate logs.json even if it is unchanged")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="only validate the files that would be migrated, without contacting DynamoDB")
+    parser.add_argument("--force", action="store_true",
+                        help="migrate every JSON file, ignoring the saved state")
+    return parser.parse_args()
+
+
+def setup_logging():
+    """
+    Send all migration output through a queue drained by a background thread,
+    so the upload never waits on a slow stdout (pipes, CI log collectors)
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    
+    listener.start()
+    # Flushes whatever is still queued, including on sys.exit()
+    atexit.register(listener.stop)
+    return logging.getLogger("migrate_to_dynamodb")
+
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("DynamoDB Migration Script - All JSON Data")
-    print("=" * 60)
-    print("")
-    print("This script will:")
-    print("1. Create DynamoDB tables (logs, metrics, employees, admins, tickets)")
-    print("2. Load data from JSON files")
-    print("3. Insert all data into DynamoDB")
-    print("")
-    print("Files to migrate:")
-    print("  - logs.json -> logs-table")
-    print("  - metrics.json -> metrics-table")
-    print("  - employees.json -> employees-table")
-    print("  - admins.json -> admins-table")
-    print("  - tickets.json -> tickets-table")
-    print("")
+    # Parsed first so --help and unknown options exit before any output
+    args = parse_args()
+    
+    # Everything goes through the same queue, so lines stay in order
+    logger = setup_logging()
+    logger.info(BANNER)
+    
+    # Only migrate tables whose source file changed since the last successful run
+    state = load_state()
+    hashes = {table: file_sha256(path) for table, path in SOURCE_FILES.items() if path.exists()}
+    if args.force:
+        stale = set(hashes)
+    else:
+        stale = {table for table, digest in hashes.items() if state.get(state_key(table)) != digest}
+        if not args.dry_run:
+            # The state file can outlive the data; refill tables that were deleted or emptied since
+            for table in sorted(set(hashes) - stale):
+                if not table_has_items(table):
+                    logger.info(f"{TABLE_NAMES[table]} is missing or empty, migrating {table} again")
+                    stale.add(table)
+    if args.clear and "logs" in hashes:
+        # The logs table is about to be emptied, so it has to be refilled regardless
+        stale.add("logs")
+    if not stale:
+        logger.info("✓ All JSON files are unchanged since the last migration, nothing to do")
+        sys.exit(0)
+    logger.info(f"Changed since last migration: {', '.join(sorted(stale))}")
+    logger.info("")
+    
+    # Catch malformed items locally instead of as failed batch writes
+    valid = validate_files(stale, logger)
+    if args.dry_run:
+        sys.exit(0 if valid else 1)
+    if not valid:
+        logger.error("\nFix the invalid items above (or run with --dry-run to re-check); nothing was written")
+        sys.exit(1)
+    logger.info("")
     
     # Run migration
-    results = migrate_json_to_dynamodb()
+    results = migrate_json_to_dynamodb(tables=stale, clear=args.clear)
+    
+    # Remember the tables that went through completely
+    for table in results["migrated"]:
+        state[state_key(table)] = hashes[table]
+    save_state(state)
     
     # Exit with error code if there were errors
     if results["errors"]:
         sys.exit(1)
     else:
-        print("\n✓ Migration completed successfully!")
+        logger.info("\n✓ Migration completed successfully!")
         sys.exit(0)
 
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Shared async HTTP helper for the batch test scripts
+Posts tool calls to the MCP client's /nlp/execute endpoint
+"""
+import json
+
+import aiohttp
+
+# Prefer orjson for encoding request payloads when it's installed
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+NLP_EXECUTE_URL = 'http://localhost:8080/nlp/execute'
+
+# Batch creates block on terraform, so allow up to 10 minutes per call
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=600)
+
+
+class ToolHTTPError(Exception):
+    """Raised when /nlp/execute answers with an HTTP error status"""
+
+    def __init__(self, status, body):
+        super().__init__(f"HTTP Error {status}")
+        self.status = status
+        self.body = body
+
+
+async def post_tool(session, tool, args):
+    """Execute a tool through /nlp/execute and return the response body text"""
+    payload = {
+        "tool": tool,
+        "args": args,
+        "userConfirmed": True
+    }
+    headers = {'Content-Type': 'application/json'}
+    async with session.post(NLP_EXECUTE_URL, data=_dumps(payload), headers=headers, timeout=REQUEST_TIMEOUT) as resp:
+        body = await resp.text()
+        if resp.status >= 400:
+            raise ToolHTTPError(resp.status, body)
+        return body
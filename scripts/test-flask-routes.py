@@ -4,6 +4,7 @@ Verifies mock routes respond and CORS header is present when Origin is sent.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure project root is on PYTHONPATH so we can import app
@@ -24,26 +25,38 @@ ORIGIN = "http://localhost:5173"
 def assert_cors(headers):
     aca = headers.get("Access-Control-Allow-Origin") or headers.get("access-control-allow-origin")
     if not aca:
-        print("❌ Missing Access-Control-Allow-Origin on Flask response")
-        sys.exit(2)
+        return 2, "❌ Missing Access-Control-Allow-Origin on Flask response"
+    return 0, None
 
 def expect_ok(resp):
     if resp.status_code < 200 or resp.status_code >= 300:
-        print(f"❌ Unexpected status {resp.status_code}: {resp.data[:200]!r}")
-        sys.exit(1)
+        return 1, f"❌ Unexpected status {resp.status_code}: {resp.data[:200]!r}"
+    return 0, None
+
+# (route, header check); the customer health summary has no LLM dependency
+ROUTES = [
+    ("/monitor/mock/metrics", assert_cors),
+    ("/monitor/mock/customers/health", assert_cors),
+]
+
+def _check(route, check_headers):
+    """GET one route and return (exit_code, message); 0 means it passed"""
+    resp = client.get(route, headers={"Origin": ORIGIN})
+    for code, message in (expect_ok(resp), check_headers(resp.headers)):
+        if code:
+            return code, f"{message} ({route})"
+    return 0, f"✅ {route} OK with CORS"
 
 def main():
-    # Basic mock metrics endpoint
-    resp = client.get("/monitor/mock/metrics", headers={"Origin": ORIGIN})
-    expect_ok(resp)
-    assert_cors(resp.headers)
-    print("✅ /monitor/mock/metrics OK with CORS")
-
-    # Customer health summary (no LLM dependency)
-    resp = client.get("/monitor/mock/customers/health", headers={"Origin": ORIGIN})
-    expect_ok(resp)
-    assert_cors(resp.headers)
-    print("✅ /monitor/mock/customers/health OK with CORS")
+    # Routes are independent reads, so check them concurrently
+    with ThreadPoolExecutor(len(ROUTES)) as ex:
+        results = list(ex.map(lambda rc: _check(*rc), ROUTES))
+
+    for _, message in results:
+        print(message)
+    failures = [code for code, _ in results if code]
+    if failures:
+        sys.exit(failures[0])
 
     print("✅ Flask route smoke tests passed")
 
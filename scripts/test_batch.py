@@ -1,24 +1,19 @@
 #!/usr/bin/env python3
-import json
+import asyncio
 import sys
-import urllib.request
 
-def main():
-    url = 'http://localhost:8080/nlp/execute'
-    payload = {
-        "tool": "batchCreate",
-        "args": {"resource_type": "ec2", "count": 3, "customer_name": "rtg-test"},
-        "userConfirmed": True
-    }
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
-    try:
-        with urllib.request.urlopen(req, timeout=600) as resp:
-            body = resp.read().decode('utf-8')
-            print(body)
-    except Exception as e:
-        print('ERROR:', e)
-        sys.exit(1)
+import aiohttp
+
+from batch_client import post_tool
+
+async def main():
+    args = {"resource_type": "ec2", "count": 3, "customer_name": "rtg-test", "parallelism": 3}
+    async with aiohttp.ClientSession() as session:
+        try:
+            print(await post_tool(session, "batchCreate", args))
+        except Exception as e:
+            print('ERROR:', e)
+            sys.exit(1)
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
@@ -1,25 +1,35 @@
 #!/usr/bin/env python3
 """
 Comprehensive batch creation test script
-Tests EC2, S3, and Lambda batch creation sequentially
+Tests EC2, S3, and Lambda batch creation concurrently
 """
-import json
+import asyncio
 import sys
 import time
-import urllib.request
 
-def test_batch_create(resource_type, count=3, customer_name="rtg-test", aws_region="us-east-1"):
+import aiohttp
+
+from batch_client import ToolHTTPError, post_tool
+
+RULE = "=" * 70
+BANNER = f"""
+{RULE}
+🚀 COMPREHENSIVE BATCH CREATION TEST SUITE
+{RULE}
+This script will test batch creation for:
+  • EC2 Instances
+  • S3 Buckets
+  • Lambda Functions
+{RULE}"""
+
+async def test_batch_create(session, resource_type, count=3, customer_name="rtg-test", aws_region="us-east-1"):
     """Test batch creation for a specific resource type"""
-    url = 'http://localhost:8080/nlp/execute'
-    payload = {
-        "tool": "batchCreate",
-        "args": {
-            "resource_type": resource_type,
-            "count": count,
-            "customer_name": customer_name,
-            "aws_region": aws_region
-        },
-        "userConfirmed": True
+    args = {
+        "resource_type": resource_type,
+        "count": count,
+        "parallelism": count,
+        "customer_name": customer_name,
+        "aws_region": aws_region
     }
     
     resource_icons = {
@@ -29,64 +39,53 @@ def test_batch_create(resource_type, count=3, customer_name="rtg-test", aws_regi
     }
     icon = resource_icons.get(resource_type, "📦")
     
-    print(f"\n{'='*70}")
-    print(f"{icon} Testing {resource_type.upper()} Batch Creation")
-    print(f"{'='*70}")
-    print(f"📊 Count: {count}")
-    print(f"👤 Customer: {customer_name}")
-    print(f"🌍 Region: {aws_region}")
-    print("-" * 70)
-    
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    # Tests run concurrently, so each one reports as a single block once it finishes
+    report = [
+        f"\n{'='*70}",
+        f"{icon} Testing {resource_type.upper()} Batch Creation",
+        f"{'='*70}",
+        f"📊 Count: {count}",
+        f"👤 Customer: {customer_name}",
+        f"🌍 Region: {aws_region}",
+        "-" * 70,
+    ]
     
     start_time = time.time()
     
     try:
-        with urllib.request.urlopen(req, timeout=600) as resp:
-            elapsed = time.time() - start_time
-            body = resp.read().decode('utf-8')
-            print(f"\n✅ {resource_type.upper()} Batch Creation Successful!")
-            print(f"⏱️  Time taken: {elapsed:.2f} seconds")
-            print(f"\n📋 Response:")
-            print(body)
-            return True
-    except urllib.error.HTTPError as e:
+        body = await post_tool(session, "batchCreate", args)
         elapsed = time.time() - start_time
-        error_body = e.read().decode('utf-8')
-        print(f"\n❌ {resource_type.upper()} Batch Creation Failed!")
-        print(f"⏱️  Time taken: {elapsed:.2f} seconds")
-        print(f"HTTP Error {e.code}:")
-        print(error_body)
-        return False
+        report.append(f"\n✅ {resource_type.upper()} Batch Creation Successful!")
+        report.append(f"⏱️  Time taken: {elapsed:.2f} seconds")
+        report.append(f"\n📋 Response:")
+        report.append(body)
+        success = True
+    except ToolHTTPError as e:
+        elapsed = time.time() - start_time
+        report.append(f"\n❌ {resource_type.upper()} Batch Creation Failed!")
+        report.append(f"⏱️  Time taken: {elapsed:.2f} seconds")
+        report.append(f"HTTP Error {e.status}:")
+        report.append(e.body)
+        success = False
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"\n❌ {resource_type.upper()} Batch Creation Failed!")
-        print(f"⏱️  Time taken: {elapsed:.2f} seconds")
-        print(f"Error: {e}")
-        return False
+        report.append(f"\n❌ {resource_type.upper()} Batch Creation Failed!")
+        report.append(f"⏱️  Time taken: {elapsed:.2f} seconds")
+        report.append(f"Error: {e}")
+        success = False
+    
+    print("\n".join(report))
+    return success
 
-def main():
-    print("\n" + "="*70)
-    print("🚀 COMPREHENSIVE BATCH CREATION TEST SUITE")
-    print("="*70)
-    print("This script will test batch creation for:")
-    print("  • EC2 Instances")
-    print("  • S3 Buckets")
-    print("  • Lambda Functions")
-    print("="*70)
+async def main():
+    print(BANNER)
     
-    results = {}
     resource_types = ["ec2", "s3", "lambda"]
     
-    for resource_type in resource_types:
-        success = test_batch_create(resource_type)
-        results[resource_type] = success
-        
-        # Small delay between tests
-        if resource_type != resource_types[-1]:
-            print(f"\n⏳ Waiting 3 seconds before next test...")
-            time.sleep(3)
+    # Each resource type has its own terraform working directory, so they can run side by side
+    async with aiohttp.ClientSession() as session:
+        outcomes = await asyncio.gather(*(test_batch_create(session, r) for r in resource_types))
+    results = dict(zip(resource_types, outcomes))
     
     # Summary
     print("\n" + "="*70)
@@ -113,4 +112,4 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
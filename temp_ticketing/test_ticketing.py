@@ -3,6 +3,8 @@ Test Script for Ticketing System
 Tests all major functionality: ticket creation, assignment, approval, rejection
 """
 import json
+import sys
+from collections import Counter
 from ticket_system_standalone import (
     load_tickets, load_employees, load_admins,
     create_ticket_from_issue, approve_critical_ticket, reject_critical_ticket,
@@ -93,12 +95,13 @@ def test_create_critical_ticket():
         return None
 
 
-def test_approve_critical_ticket(ticket_id):
+def test_approve_critical_ticket(ticket_id, admins=None):
     """Test admin approval of critical ticket"""
     print_section("TEST 4: Admin Approves Critical Ticket")
     
-    # Use first admin
-    admins = load_admins()
+    # Use first admin (reuse the list loaded in TEST 1 when given)
+    if admins is None:
+        admins = load_admins()
     if not admins:
         print("❌ No admins available for testing")
         return None
@@ -124,12 +127,13 @@ def test_approve_critical_ticket(ticket_id):
         return None
 
 
-def test_reject_critical_ticket(ticket_id):
+def test_reject_critical_ticket(ticket_id, admins=None):
     """Test admin rejection of critical ticket"""
     print_section("TEST 5: Admin Rejects Critical Ticket")
     
-    # Use first admin
-    admins = load_admins()
+    # Use first admin (reuse the list loaded in TEST 1 when given)
+    if admins is None:
+        admins = load_admins()
     if not admins:
         print("❌ No admins available for testing")
         return None
@@ -158,26 +162,30 @@ def test_reject_critical_ticket(ticket_id):
         return None
 
 
-def test_view_all_tickets():
+def test_view_all_tickets(tickets=None):
     """View all current tickets"""
     print_section("TEST 6: View All Tickets")
     
-    tickets = load_tickets()
+    if tickets is None:
+        tickets = load_tickets()
     
     if not tickets:
         print("No tickets found")
         return
     
-    print(f"Total Tickets: {len(tickets)}\n")
+    # Collect every line and write the listing in one call
+    lines = [f"Total Tickets: {len(tickets)}\n"]
     
     for ticket in tickets:
-        print(f"ID: {ticket['ticket_id']}")
-        print(f"   Issue: {ticket['issue']}")
-        print(f"   Status: {ticket['status']}")
-        print(f"   Severity: {ticket['severity']}")
+        lines.append(f"ID: {ticket['ticket_id']}")
+        lines.append(f"   Issue: {ticket['issue']}")
+        lines.append(f"   Status: {ticket['status']}")
+        lines.append(f"   Severity: {ticket['severity']}")
         if ticket.get('assigned_employee_name'):
-            print(f"   Assigned: {ticket['assigned_employee_name']}")
-        print()
+            lines.append(f"   Assigned: {ticket['assigned_employee_name']}")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def run_all_tests():
@@ -203,7 +211,7 @@ def run_all_tests():
     
     # Test 4: Approve the critical ticket
     if critical_ticket_1:
-        test_approve_critical_ticket(critical_ticket_1['ticket_id'])
+        test_approve_critical_ticket(critical_ticket_1['ticket_id'], admins)
     
     # Test 5: Create another critical ticket and reject it
     critical_ticket_2 = create_ticket_from_issue(
@@ -216,23 +224,17 @@ def run_all_tests():
     )
     
     if critical_ticket_2:
-        test_reject_critical_ticket(critical_ticket_2['ticket_id'])
+        test_reject_critical_ticket(critical_ticket_2['ticket_id'], admins)
     
-    # Test 6: View all tickets
-    test_view_all_tickets()
+    # Test 6: View all tickets (loaded once and shared with the summary)
+    all_tickets = load_tickets()
+    test_view_all_tickets(all_tickets)
     
     # Final Summary
     print_section("TEST SUMMARY")
-    all_tickets = load_tickets()
-    
-    status_counts = {}
-    severity_counts = {}
     
-    for ticket in all_tickets:
-        status = ticket.get('status', 'UNKNOWN')
-        severity = ticket.get('severity', 'UNKNOWN')
-        status_counts[status] = status_counts.get(status, 0) + 1
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+    status_counts = Counter(ticket.get('status', 'UNKNOWN') for ticket in all_tickets)
+    severity_counts = Counter(ticket.get('severity', 'UNKNOWN') for ticket in all_tickets)
     
     print(f"Total Tickets: {len(all_tickets)}")
     print(f"\nBy Status:")
@@ -350,6 +350,7 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
         # Assign to employee
         assigned_employee_id = assigned_employee.get("employee_id")
         update_employee_workload(assigned_employee_id, 1)
+        now = datetime.utcnow().isoformat() + 'Z'
         
         ticket = {
             "ticket_id": ticket_id,
@@ -357,10 +358,10 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
             "status": "ASSIGNED",
             "severity": severity,
             "resource_id": resource_id,
-            "created_at": datetime.utcnow().isoformat() + 'Z',
+            "created_at": now,
             "pending_admin_approval": False,
             "assigned_employee_ID": assigned_employee_id,
-            "assigned_at": datetime.utcnow().isoformat() + 'Z',
+            "assigned_at": now,
             "issue_type": issue_type,
             "description": description or issue,
             "customer_name": customer_name,
@@ -425,17 +426,20 @@ def approve_critical_ticket(ticket_id, admin_id, employee_id=None):
     update_employee_workload(assigned_employee_id, 1)
     
     # Update ticket
+    now = datetime.utcnow().isoformat() + 'Z'
     updates = {
         "status": "ASSIGNED",
         "pending_admin_approval": False,
         "assigned_employee_ID": assigned_employee_id,
-        "assigned_at": datetime.utcnow().isoformat() + 'Z',
+        "assigned_at": now,
         "approved_by": admin_id,
-        "approved_at": datetime.utcnow().isoformat() + 'Z'
+        "approved_at": now
     }
     
     if update_ticket(ticket_id, updates):
-        return {"success": True, "ticket": get_ticket_by_id(ticket_id)}
+        # Return the already-loaded ticket with the updates applied instead of re-reading it
+        ticket.update(updates)
+        return {"success": True, "ticket": ticket}
     return {"error": "Failed to update ticket"}
 
 
@@ -458,7 +462,9 @@ def reject_critical_ticket(ticket_id, admin_id, reason=None):
     }
     
     if update_ticket(ticket_id, updates):
-        return {"success": True, "ticket": get_ticket_by_id(ticket_id)}
+        # Return the already-loaded ticket with the updates applied instead of re-reading it
+        ticket.update(updates)
+        return {"success": True, "ticket": ticket}
     return {"error": "Failed to update ticket"}
 
 
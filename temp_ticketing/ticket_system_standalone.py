@@ -4,8 +4,10 @@ Handles automatic ticket creation, assignment, and admin approval for CRITICAL t
 """
 import json
 import os
-import uuid
-from datetime import datetime
+import secrets
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 # Use local data directory
@@ -14,6 +16,121 @@ TICKETS_FILE = BASE_DIR / "data" / "tickets.json"
 EMPLOYEES_FILE = BASE_DIR / "data" / "employees.json"
 ADMINS_FILE = BASE_DIR / "data" / "admins.json"
 
+# Data files are written compact; set TICKETS_PRETTY=true for indented, human-readable JSON
+PRETTY_JSON = os.getenv("TICKETS_PRETTY", "false").lower() == "true"
+
+
+# ============================================================================
+# JSON File Cache
+# ============================================================================
+
+# path -> ((st_mtime_ns, st_size), parsed JSON); reused until the file changes on disk
+_CACHE = {}
+
+
+def _file_key(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_cached(path):
+    """Parse a JSON file, reusing the previous result while its mtime and size are unchanged"""
+    try:
+        key = _file_key(path)
+    except FileNotFoundError:
+        _CACHE.pop(path, None)
+        return None
+    cached = _CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = json.loads(path.read_bytes())
+    _CACHE[path] = (key, data)
+    return data
+
+
+def _save_cached(path, data):
+    """Write data as JSON and keep it as the cached parse of the new file"""
+    # Write a temp file and rename it over the target so a crash never leaves a truncated file
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, 'w') as f:
+            if PRETTY_JSON:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        # The cached list may hold changes that never reached disk; re-read next time
+        _CACHE.pop(path, None)
+        if tmp.exists():
+            tmp.unlink()
+        raise
+    _CACHE[path] = (_file_key(path), data)
+
+
+# path -> (indexed list, its length, {id: item}) for O(1) lookups by id
+_INDEXES = {}
+
+EMPLOYEE_ID_FIELDS = ("employee_id", "id")
+ADMIN_ID_FIELDS = ("admin_id",)
+TICKET_ID_FIELDS = ("ticket_id",)
+
+
+def _index(path, items, fields):
+    """Map id -> item for a loaded list, rebuilt only when the list is replaced or changes length"""
+    cached = _INDEXES.get(path)
+    if cached and cached[0] is items and cached[1] == len(items):
+        return cached[2]
+    index = {}
+    for item in items:
+        _index_item(index, item, fields)
+    _INDEXES[path] = (items, len(items), index)
+    return index
+
+
+def _index_item(index, item, fields):
+    # First item wins, matching the original first-match linear scan
+    for field in fields:
+        value = item.get(field)
+        if value is not None:
+            index.setdefault(value, item)
+
+
+def _index_append(path, items, item, fields):
+    """Record an item just appended to items in its index, if one exists"""
+    cached = _INDEXES.get(path)
+    if cached and cached[0] is items:
+        _index_item(cached[2], item, fields)
+        _INDEXES[path] = (items, len(items), cached[2])
+
+
+class _Transaction:
+    """A loaded list plus a dirty flag; saved once on exit if the caller changed it"""
+    def __init__(self, items):
+        self.items = items
+        self.dirty = False
+        self.saved = False
+
+
+@contextmanager
+def _with_employees():
+    """Load employees once for a block of reads/updates and save at most once"""
+    txn = _Transaction(load_employees())
+    yield txn
+    if txn.dirty:
+        txn.saved = save_employees(txn.items)
+
+
+@contextmanager
+def _with_tickets():
+    """Load tickets once for a block of reads/updates and save at most once"""
+    txn = _Transaction(load_tickets())
+    yield txn
+    if txn.dirty:
+        txn.saved = save_tickets(txn.items)
+
 
 # ============================================================================
 # Employee Database Functions
@@ -22,15 +139,12 @@ ADMINS_FILE = BASE_DIR / "data" / "admins.json"
 def load_employees():
     """Load employees from employees.json"""
     try:
-        if EMPLOYEES_FILE.exists():
-            with open(EMPLOYEES_FILE, 'r') as f:
-                data = json.load(f)
-                # Handle both list and dict with "employees" key
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict) and "employees" in data:
-                    return data["employees"]
-                return []
+        data = _load_cached(EMPLOYEES_FILE)
+        # Handle both list and dict with "employees" key
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and "employees" in data:
+            return data["employees"]
         return []
     except Exception as e:
         print(f"Error loading employees: {e}")
@@ -40,9 +154,8 @@ def load_employees():
 def save_employees(employees_list):
     """Save employees to employees.json"""
     try:
-        with open(EMPLOYEES_FILE, 'w') as f:
-            # Always save with "employees" wrapper
-            json.dump({"employees": employees_list}, f, indent=2)
+        # Always save with "employees" wrapper
+        _save_cached(EMPLOYEES_FILE, {"employees": employees_list})
         return True
     except Exception as e:
         print(f"Error saving employees: {e}")
@@ -51,27 +164,26 @@ def save_employees(employees_list):
 
 def get_employee_by_id(employee_id):
     """Get employee by ID"""
-    employees = load_employees()
-    for employee in employees:
-        # Check both 'id' and 'employee_id' fields
-        if employee.get("id") == employee_id or employee.get("employee_id") == employee_id:
-            return employee
-    return None
+    # Matches either the 'employee_id' or the 'id' field
+    return _index(EMPLOYEES_FILE, load_employees(), EMPLOYEE_ID_FIELDS).get(employee_id)
+
+
+def _apply_workload(employee, increment):
+    # Initialize current_workload if not present
+    if "current_workload" not in employee:
+        employee["current_workload"] = 0
+    employee["current_workload"] = max(0, employee["current_workload"] + increment)
 
 
 def update_employee_workload(employee_id, increment=1):
     """Update employee workload (increment or decrement)"""
-    employees = load_employees()
-    for employee in employees:
-        # Check both 'id' and 'employee_id' fields
-        if employee.get("id") == employee_id or employee.get("employee_id") == employee_id:
-            # Initialize current_workload if not present
-            if "current_workload" not in employee:
-                employee["current_workload"] = 0
-            employee["current_workload"] = max(0, employee["current_workload"] + increment)
-            save_employees(employees)
-            return True
-    return False
+    with _with_employees() as txn:
+        employee = _index(EMPLOYEES_FILE, txn.items, EMPLOYEE_ID_FIELDS).get(employee_id)
+        if employee is None:
+            return False
+        _apply_workload(employee, increment)
+        txn.dirty = True
+    return True
 
 
 # ============================================================================
@@ -81,15 +193,12 @@ def update_employee_workload(employee_id, increment=1):
 def load_admins():
     """Load admins from admins.json"""
     try:
-        if ADMINS_FILE.exists():
-            with open(ADMINS_FILE, 'r') as f:
-                data = json.load(f)
-                # Handle both list and dict with "admins" key
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict) and "admins" in data:
-                    return data["admins"]
-                return []
+        data = _load_cached(ADMINS_FILE)
+        # Handle both list and dict with "admins" key
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and "admins" in data:
+            return data["admins"]
         return []
     except Exception as e:
         print(f"Error loading admins: {e}")
@@ -99,8 +208,7 @@ def load_admins():
 def save_admins(data):
     """Save admins to admins.json"""
     try:
-        with open(ADMINS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _save_cached(ADMINS_FILE, data)
         return True
     except Exception as e:
         print(f"Error saving admins: {e}")
@@ -109,11 +217,7 @@ def save_admins(data):
 
 def get_admin_by_id(admin_id):
     """Get admin by ID"""
-    admins = load_admins()
-    for admin in admins:
-        if admin.get("admin_id") == admin_id:
-            return admin
-    return None
+    return _index(ADMINS_FILE, load_admins(), ADMIN_ID_FIELDS).get(admin_id)
 
 
 # ============================================================================
@@ -123,11 +227,8 @@ def get_admin_by_id(admin_id):
 def load_tickets():
     """Load tickets from tickets.json"""
     try:
-        if TICKETS_FILE.exists():
-            with open(TICKETS_FILE, 'r') as f:
-                data = json.load(f)
-                return data.get("tickets", [])
-        return []
+        data = _load_cached(TICKETS_FILE)
+        return data.get("tickets", []) if data else []
     except Exception as e:
         print(f"Error loading tickets: {e}")
         return []
@@ -136,8 +237,7 @@ def load_tickets():
 def save_tickets(tickets):
     """Save tickets to tickets.json"""
     try:
-        with open(TICKETS_FILE, 'w') as f:
-            json.dump({"tickets": tickets}, f, indent=2)
+        _save_cached(TICKETS_FILE, {"tickets": tickets})
         return True
     except Exception as e:
         print(f"Error saving tickets: {e}")
@@ -146,44 +246,56 @@ def save_tickets(tickets):
 
 def get_ticket_by_id(ticket_id):
     """Get ticket by ID"""
-    tickets = load_tickets()
-    for ticket in tickets:
-        if ticket.get("ticket_id") == ticket_id:
-            return ticket
-    return None
+    return _index(TICKETS_FILE, load_tickets(), TICKET_ID_FIELDS).get(ticket_id)
 
 
 def create_ticket(ticket_data):
     """Create a new ticket"""
-    tickets = load_tickets()
-    tickets.append(ticket_data)
-    return save_tickets(tickets)
+    with _with_tickets() as txn:
+        txn.items.append(ticket_data)
+        _index_append(TICKETS_FILE, txn.items, ticket_data, TICKET_ID_FIELDS)
+        txn.dirty = True
+    return txn.saved
 
 
 def update_ticket(ticket_id, updates):
     """Update ticket with new data"""
-    tickets = load_tickets()
-    for ticket in tickets:
-        if ticket.get("ticket_id") == ticket_id:
-            ticket.update(updates)
-            return save_tickets(tickets)
-    return False
+    with _with_tickets() as txn:
+        ticket = _index(TICKETS_FILE, txn.items, TICKET_ID_FIELDS).get(ticket_id)
+        if ticket is None:
+            return False
+        ticket.update(updates)
+        txn.dirty = True
+    return txn.saved
 
 
 # ============================================================================
 # Auto-Assignment Logic
 # ============================================================================
 
+EXPERIENCE_SCORES = {"senior": 25, "mid": 18, "junior": 12, "entry": 8}
+
+
+@lru_cache(maxsize=1024)
+def _lower_skills(skills):
+    """Lowercased frozenset of a skills tuple (cached - the same skill lists recur across calls)"""
+    return frozenset(skill.lower() for skill in skills)
+
+
 def score_employee(employee, required_skills):
     """
     Score an employee based on skills, experience, and workload
     Returns: Score (0-100)
     """
+    return _score_employee(employee, _lower_skills(tuple(required_skills)))
+
+
+def _score_employee(employee, required_skills_lower):
+    # score_employee with the required skills already lowercased
     score = 0
     
     # Skill match (50% weight)
-    employee_skills = set(skill.lower() for skill in employee.get("skills", []))
-    required_skills_lower = set(skill.lower() for skill in required_skills)
+    employee_skills = _lower_skills(tuple(employee.get("skills", ())))
     
     if required_skills_lower:
         match_count = len(employee_skills & required_skills_lower)
@@ -194,8 +306,7 @@ def score_employee(employee, required_skills):
     
     # Experience level (25% weight)
     experience_level = employee.get("experience_level", "junior").lower()
-    experience_scores = {"senior": 25, "mid": 18, "junior": 12, "entry": 8}
-    score += experience_scores.get(experience_level, 12)
+    score += EXPERIENCE_SCORES.get(experience_level, 12)
     
     # Current workload (25% weight) - lower is better
     current_workload = employee.get("current_workload", 0)
@@ -209,53 +320,61 @@ def score_employee(employee, required_skills):
     return round(score, 2)
 
 
-def find_best_employee(required_skills, issue_type):
+def find_best_employee(required_skills, issue_type, employees=None):
     """
     Find the best employee for a ticket based on scoring
+    employees: already loaded employee list to pick from (loaded when omitted)
     Returns: Employee dictionary or None
     """
-    employees = load_employees()
+    if employees is None:
+        employees = load_employees()
     
     if not employees:
         return None
     
-    # Score all employees
-    scored_employees = []
-    for employee in employees:
-        score = score_employee(employee, required_skills)
-        scored_employees.append((score, employee))
-    
-    # Sort by score (highest first)
-    scored_employees.sort(key=lambda x: x[0], reverse=True)
+    # Only score employees with spare capacity; if everyone is at their limit, fall back to all of them
+    # so the ticket still gets routed
+    available = [
+        employee for employee in employees
+        if employee.get("current_workload", 0) < employee.get("max_workload", 5)
+    ] or employees
     
-    # Return best employee
-    if scored_employees:
-        return scored_employees[0][1]
-    return None
+    # Single pass for the highest score; ties go to the earliest employee, as with the stable sort before
+    required_skills_lower = _lower_skills(tuple(required_skills))
+    return max(available, key=lambda employee: _score_employee(employee, required_skills_lower))
+
 
+SKILL_MAP = {
+    "memory_leak": ("Python", "AWS", "DevOps"),
+    "cpu_spike": ("AWS", "DevOps", "Performance"),
+    "disk_full": ("AWS", "DevOps", "Storage"),
+    "network_issue": ("AWS", "Network", "DevOps"),
+    "security": ("Security", "AWS", "DevOps"),
+    "performance": ("Performance", "AWS", "DevOps"),
+    "infrastructure": ("AWS", "DevOps", "Infrastructure")
+}
+DEFAULT_SKILLS = ("AWS", "DevOps")
 
+
+@lru_cache(maxsize=64)
 def determine_required_skills(issue_type, severity):
-    """Determine required skills based on issue type and severity"""
-    skill_map = {
-        "memory_leak": ["Python", "AWS", "DevOps"],
-        "cpu_spike": ["AWS", "DevOps", "Performance"],
-        "disk_full": ["AWS", "DevOps", "Storage"],
-        "network_issue": ["AWS", "Network", "DevOps"],
-        "security": ["Security", "AWS", "DevOps"],
-        "performance": ["Performance", "AWS", "DevOps"],
-        "infrastructure": ["AWS", "DevOps", "Infrastructure"]
-    }
-    
-    return skill_map.get(issue_type, ["AWS", "DevOps"])
+    """Determine required skills based on issue type and severity (cached - returns a shared tuple)"""
+    return SKILL_MAP.get(issue_type, DEFAULT_SKILLS)
 
 
 # ============================================================================
 # Ticket Creation Functions
 # ============================================================================
 
+def utc_timestamp():
+    """Current UTC time in ISO 8601 with a 'Z' suffix (same format as utcnow().isoformat() + 'Z')"""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 def generate_ticket_id():
     """Generate a unique ticket ID"""
-    return f"TCKT_{str(uuid.uuid4())[:8].upper()}"
+    # 8 uppercase hex chars from 4 random bytes, same shape as the old uuid4 prefix
+    return f"TCKT_{secrets.token_hex(4).upper()}"
 
 
 def create_critical_ticket(issue, resource_id, severity, issue_type, description=None, 
@@ -265,6 +384,7 @@ def create_critical_ticket(issue, resource_id, severity, issue_type, description
     Returns: Ticket dictionary with PENDING_APPROVAL status
     """
     ticket_id = generate_ticket_id()
+    now = utc_timestamp()
     
     # Determine required skills and suggest employee
     required_skills = determine_required_skills(issue_type, severity)
@@ -276,7 +396,7 @@ def create_critical_ticket(issue, resource_id, severity, issue_type, description
         "status": "PENDING_APPROVAL",
         "severity": severity,
         "resource_id": resource_id,
-        "created_at": datetime.utcnow().isoformat() + 'Z',
+        "created_at": now,
         "pending_admin_approval": True,
         "suggested_employee_id": suggested_employee.get("employee_id") or suggested_employee.get("id") if suggested_employee else None,
         "suggested_employee_name": suggested_employee.get("name") if suggested_employee else None,
@@ -285,7 +405,7 @@ def create_critical_ticket(issue, resource_id, severity, issue_type, description
         "issue_type": issue_type,
         "description": description or issue,
         "customer_name": customer_name,
-        "required_skills": required_skills
+        "required_skills": list(required_skills)
     }
     
     # Save ticket
@@ -301,10 +421,16 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
     Returns: Ticket dictionary with ASSIGNED status
     """
     ticket_id = generate_ticket_id()
+    now = utc_timestamp()
     
-    # Determine required skills and find best employee
+    # Determine required skills, then pick and charge the best employee
+    # in one load/save of employees.json
     required_skills = determine_required_skills(issue_type, severity)
-    assigned_employee = find_best_employee(required_skills, issue_type)
+    with _with_employees() as txn:
+        assigned_employee = find_best_employee(required_skills, issue_type, txn.items)
+        if assigned_employee:
+            _apply_workload(assigned_employee, 1)
+            txn.dirty = True
     
     if not assigned_employee:
         # If no employee available, create unassigned ticket
@@ -314,7 +440,7 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
             "status": "OPEN",
             "severity": severity,
             "resource_id": resource_id,
-            "created_at": datetime.utcnow().isoformat() + 'Z',
+            "created_at": now,
             "pending_admin_approval": False,
             "assigned_employee_id": None,
             "assigned_at": None,
@@ -325,7 +451,6 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
     else:
         # Assign to employee
         assigned_employee_id = assigned_employee.get("employee_id") or assigned_employee.get("id")
-        update_employee_workload(assigned_employee_id, 1)
         
         ticket = {
             "ticket_id": ticket_id,
@@ -333,11 +458,11 @@ def create_non_critical_ticket(issue, resource_id, severity, issue_type, descrip
             "status": "ASSIGNED",
             "severity": severity,
             "resource_id": resource_id,
-            "created_at": datetime.utcnow().isoformat() + 'Z',
+            "created_at": now,
             "pending_admin_approval": False,
             "assigned_employee_id": assigned_employee_id,
             "assigned_employee_name": assigned_employee.get("name"),
-            "assigned_at": datetime.utcnow().isoformat() + 'Z',
+            "assigned_at": now,
             "issue_type": issue_type,
             "description": description or issue,
             "customer_name": customer_name
@@ -379,61 +504,70 @@ def approve_critical_ticket(ticket_id, admin_id, employee_id=None):
     Approve a CRITICAL ticket and assign to employee
     If employee_id is None, uses suggested_employee_id
     """
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
-        return {"error": "Ticket not found"}
-    
-    if ticket.get("status") != "PENDING_APPROVAL":
-        return {"error": "Ticket is not pending approval"}
-    
-    # Use provided employee_id or suggested_employee_id
-    assigned_employee_id = employee_id or ticket.get("suggested_employee_id")
-    if not assigned_employee_id:
-        return {"error": "No employee specified for assignment"}
-    
-    # Check if employee exists
-    employee = get_employee_by_id(assigned_employee_id)
-    if not employee:
-        return {"error": "Employee not found"}
-    
-    # Update employee workload
-    update_employee_workload(assigned_employee_id, 1)
-    
-    # Update ticket
-    updates = {
-        "status": "ASSIGNED",
-        "pending_admin_approval": False,
-        "assigned_employee_id": assigned_employee_id,
-        "assigned_employee_name": employee.get("name"),
-        "assigned_at": datetime.utcnow().isoformat() + 'Z',
-        "approved_by": admin_id,
-        "approved_at": datetime.utcnow().isoformat() + 'Z'
-    }
+    # Look up, charge and update against one load of each file; each is saved once on exit
+    with _with_tickets() as tickets:
+        ticket = _index(TICKETS_FILE, tickets.items, TICKET_ID_FIELDS).get(ticket_id)
+        if not ticket:
+            return {"error": "Ticket not found"}
+        
+        if ticket.get("status") != "PENDING_APPROVAL":
+            return {"error": "Ticket is not pending approval"}
+        
+        # Use provided employee_id or suggested_employee_id
+        assigned_employee_id = employee_id or ticket.get("suggested_employee_id")
+        if not assigned_employee_id:
+            return {"error": "No employee specified for assignment"}
+        
+        with _with_employees() as employees:
+            # Check if employee exists
+            employee = _index(EMPLOYEES_FILE, employees.items, EMPLOYEE_ID_FIELDS).get(assigned_employee_id)
+            if not employee:
+                return {"error": "Employee not found"}
+            
+            # Update employee workload
+            _apply_workload(employee, 1)
+            employees.dirty = True
+        
+        # Update ticket
+        now = utc_timestamp()
+        ticket.update({
+            "status": "ASSIGNED",
+            "pending_admin_approval": False,
+            "assigned_employee_id": assigned_employee_id,
+            "assigned_employee_name": employee.get("name"),
+            "assigned_at": now,
+            "approved_by": admin_id,
+            "approved_at": now
+        })
+        tickets.dirty = True
     
-    if update_ticket(ticket_id, updates):
-        return {"success": True, "ticket": get_ticket_by_id(ticket_id)}
+    if tickets.saved:
+        return {"success": True, "ticket": ticket}
     return {"error": "Failed to update ticket"}
 
 
 def reject_critical_ticket(ticket_id, admin_id, reason=None):
     """Reject a CRITICAL ticket"""
-    ticket = get_ticket_by_id(ticket_id)
-    if not ticket:
-        return {"error": "Ticket not found"}
-    
-    if ticket.get("status") != "PENDING_APPROVAL":
-        return {"error": "Ticket is not pending approval"}
-    
-    # Update ticket
-    updates = {
-        "status": "REJECTED",
-        "pending_admin_approval": False,
-        "rejected_by": admin_id,
-        "rejected_at": datetime.utcnow().isoformat() + 'Z',
-        "rejection_reason": reason or "Admin rejected"
-    }
+    with _with_tickets() as tickets:
+        ticket = _index(TICKETS_FILE, tickets.items, TICKET_ID_FIELDS).get(ticket_id)
+        if not ticket:
+            return {"error": "Ticket not found"}
+        
+        if ticket.get("status") != "PENDING_APPROVAL":
+            return {"error": "Ticket is not pending approval"}
+        
+        # Update ticket
+        now = utc_timestamp()
+        ticket.update({
+            "status": "REJECTED",
+            "pending_admin_approval": False,
+            "rejected_by": admin_id,
+            "rejected_at": now,
+            "rejection_reason": reason or "Admin rejected"
+        })
+        tickets.dirty = True
     
-    if update_ticket(ticket_id, updates):
-        return {"success": True, "ticket": get_ticket_by_id(ticket_id)}
+    if tickets.saved:
+        return {"success": True, "ticket": ticket}
     return {"error": "Failed to update ticket"}
 